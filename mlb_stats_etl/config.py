@@ -1,42 +1,73 @@
 from __future__ import annotations
+import functools
 import os
 from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+_ROOT = Path(__file__).resolve().parents[1]
+_ENV_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Load .env from project root if available (at most once per process)."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(_ROOT / ".env")
+    except Exception:
+        pass
+
+
+def _as_bool(val: str) -> bool:
+    return val.lower() in ("1", "true", "yes", "y")
+
+
+def _get(name: str, default: str, cast: Callable[[str], Any] = str) -> Any:
+    """Read an env var once, cast it, and memoize the result."""
+    key = (name, default)
+    if key not in _ENV_CACHE:
+        _load_env_once()
+        _ENV_CACHE[key] = cast(os.getenv(name, default))
+    return _ENV_CACHE[key]
+
+
+def clear_cache() -> None:
+    """Forget memoized env reads so the next _get() re-reads os.environ (tests)."""
+    _ENV_CACHE.clear()
+    _load_env_once.cache_clear()
 
-# Load .env from project root if available
-try:
-    from dotenv import load_dotenv
-    _ROOT = Path(__file__).resolve().parents[1]
-    load_dotenv(_ROOT / ".env")
-except Exception:
-    pass
 
 # ---- API base ----
-BASE_URL: str = os.getenv("MLB_STATS_BASE_URL", "https://statsapi.mlb.com/api")
-DEFAULT_VER: str = os.getenv("MLB_STATS_VER", "v1")
-GAME_FEED_VER: str = os.getenv("MLB_STATS_GAME_VER", "v1.1")
-SPORT_ID: int = int(os.getenv("MLB_SPORT_ID", "1"))
+BASE_URL: str = _get("MLB_STATS_BASE_URL", "https://statsapi.mlb.com/api")
+DEFAULT_VER: str = _get("MLB_STATS_VER", "v1")
+GAME_FEED_VER: str = _get("MLB_STATS_GAME_VER", "v1.1")
+SPORT_ID: int = _get("MLB_SPORT_ID", "1", int)
 
 # ---- Concurrency / Throttling ----
-MAX_WORKERS: int = int(os.getenv("MLB_MAX_WORKERS", "6"))
-REQS_PER_SEC: float = float(os.getenv("MLB_REQS_PER_SEC", "5.0"))  # gentle default
+MAX_WORKERS: int = _get("MLB_MAX_WORKERS", "6", int)
+REQS_PER_SEC: float = _get("MLB_REQS_PER_SEC", "5.0", float)  # gentle default
+REQS_BURST: float = _get("MLB_REQS_BURST", "5", float)  # token bucket capacity
+PARSE_WORKERS: int = _get("MLB_PARSE_WORKERS", "0", int)  # processes for game feed parsing; 0 = parse in-process
 
-# ---- HTTP timeouts ----
-TIMEOUT_SECONDS: float = float(os.getenv("MLB_HTTP_TIMEOUT", "30"))
+# ---- HTTP timeouts / connection pool ----
+TIMEOUT_SECONDS: float = _get("MLB_HTTP_TIMEOUT", "30", float)
+HTTP_POOL_SIZE: int = _get("MLB_HTTP_POOL_SIZE", "20", int)  # keep-alive connections per host
 
 # ---- Caching (requests-cache) ----
-CACHE_ENABLED: bool = os.getenv("MLB_CACHE_ENABLED", "true").lower() in ("1", "true", "yes", "y")
-CACHE_PATH: str = os.getenv("MLB_CACHE_PATH", "./mlb_cache.sqlite")
-CACHE_TTL_SECONDS: int = int(os.getenv("MLB_CACHE_TTL_SECONDS", str(6 * 60 * 60)))  # 6 hours default
+CACHE_ENABLED: bool = _get("MLB_CACHE_ENABLED", "true", _as_bool)
+CACHE_PATH: str = _get("MLB_CACHE_PATH", "./mlb_cache.sqlite")
+CACHE_TTL_SECONDS: int = _get("MLB_CACHE_TTL_SECONDS", str(6 * 60 * 60), int)  # 6 hours default
 
 # ---- State path ----
-STATE_PATH: str = os.getenv("MLB_STATE_PATH", "./mlb_state.json")
+STATE_PATH: str = _get("MLB_STATE_PATH", "./mlb_state.json")
 
 # ---- DB (SingleStore/MySQL) ----
-DB_HOST: str = os.getenv("DB_HOST", "108.195.104.154")
-DB_PORT: int = int(os.getenv("DB_PORT", "3306"))
-DB_DATABASE: str = os.getenv("DB_DATABASE", "MLB")
-DB_USER: str = os.getenv("DB_USER", "root")
-DB_PASSWORD: str = os.getenv("DB_PASSWORD", "!biA4z6JvBZafh2")
+DB_HOST: str = _get("DB_HOST", "108.195.104.154")
+DB_PORT: int = _get("DB_PORT", "3306", int)
+DB_DATABASE: str = _get("DB_DATABASE", "MLB")
+DB_USER: str = _get("DB_USER", "root")
+DB_PASSWORD: str = _get("DB_PASSWORD", "!biA4z6JvBZafh2")
+DB_BULK_MIN_ROWS: int = _get("DB_BULK_MIN_ROWS", "50000", int)  # frames this large use LOAD DATA
 
 def build_db_url() -> str:
     return f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DATABASE}?charset=utf8mb4"
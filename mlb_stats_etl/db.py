@@ -1,34 +1,79 @@
 from __future__ import annotations
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Set
+import concurrent.futures as cf
+import itertools
 import logging
+import os
+import tempfile
+import threading
 import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
-from .config import build_db_url
+from sqlalchemy.engine import Engine, make_url
+from .config import build_db_url, MAX_WORKERS, DB_BULK_MIN_ROWS
 
 log = logging.getLogger("mlb_stats_etl.db")
 
+# One Engine (and therefore one connection pool) per URL for the whole process
+_ENGINE_CACHE: Dict[str, Engine] = {}
+_ENGINE_LOCK = threading.Lock()
+# Tables known to exist, keyed by engine URL; see ensure_table_exists
+_EXISTING_TABLES: Dict[str, Set[str]] = {}
+
 
 def get_engine(db_url: str | None = None) -> Engine:
     url = db_url or build_db_url()
-    engine = create_engine(url, pool_pre_ping=True, pool_recycle=3600)
-    log.info("DB engine created url=%s", url)
+    with _ENGINE_LOCK:
+        engine = _ENGINE_CACHE.get(url)
+        if engine is None:
+            # LOAD DATA LOCAL INFILE (see bulk_load) must be enabled client-side
+            connect_args = {"local_infile": True} if make_url(url).get_backend_name() == "mysql" else {}
+            engine = create_engine(
+                url,
+                pool_size=MAX_WORKERS,
+                max_overflow=MAX_WORKERS,
+                pool_pre_ping=True,
+                pool_recycle=3600,
+                connect_args=connect_args,
+            )
+            _ENGINE_CACHE[url] = engine
+            log.info("DB engine created url=%s pool_size=%s", url, MAX_WORKERS)
     return engine
 
 
+def _existing_tables(engine: Engine) -> Set[str]:
+    """Table names in the engine's current schema, loaded with one query per process."""
+    key = engine.url.render_as_string(hide_password=False)
+    tables = _EXISTING_TABLES.get(key)
+    if tables is None:
+        sql = text("SELECT table_name FROM information_schema.tables WHERE table_schema = DATABASE()")
+        with engine.begin() as conn:
+            tables = {row[0] for row in conn.execute(sql)}
+        _EXISTING_TABLES[key] = tables
+    return tables
+
+
+def invalidate_table_cache(engine: Engine | None = None) -> None:
+    """Forget cached table names for engine (or for every engine)."""
+    if engine is None:
+        _EXISTING_TABLES.clear()
+    else:
+        _EXISTING_TABLES.pop(engine.url.render_as_string(hide_password=False), None)
+
+
 def ensure_table_exists(engine: Engine, table_name: str, df: pd.DataFrame) -> None:
     """
     Create table if it doesn't exist using pandas' DDL inference (first run).
     No-op if the table already exists.
     """
-    exists_sql = text("SELECT 1 FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = :t LIMIT 1")
-    with engine.begin() as conn:
-        res = conn.execute(exists_sql, {"t": table_name}).fetchone()
-        if res:
-            return
+    existing = _existing_tables(engine)
+    if table_name in existing:
+        return
     log.info("Creating table (inferred) name=%s", table_name)
-    df.iloc[0:0].to_sql(table_name, engine, index=False, if_exists="fail")
+    # Infer DDL from full-width ints so downcast frames don't create undersized columns
+    widen = {c: "int64" for c, dt in df.dtypes.items() if dt.kind in "iu"}
+    df.iloc[0:0].astype(widen).to_sql(table_name, engine, index=False, if_exists="fail")
+    existing.add(table_name)
 
 
 def create_unique_index(engine: Engine, table: str, index_name: str, cols: Sequence[str]) -> None:
@@ -43,18 +88,15 @@ def create_unique_index(engine: Engine, table: str, index_name: str, cols: Seque
         pass
 
 
-def _chunk_iter(seq, size: int):
-    for i in range(0, len(seq), size):
-        yield seq[i:i+size]
+def _chunk_iter(iterable, size: int):
+    """Yield lists of up to size items, consuming iterable lazily."""
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
 
 
-def _clean_value(val):
-    # Normalize pandas/NumPy NA to None
-    try:
-        if pd.isna(val):
-            return None
-    except Exception:
-        pass
+def _clean_scalar(val):
+    # NA cells never reach here; _clean_frame nulls them from a precomputed mask
     # Normalize booleans (including numpy types) to 0/1
     if isinstance(val, (np.bool_, bool)):
         return 1 if bool(val) else 0
@@ -74,28 +116,112 @@ def _clean_value(val):
     return val
 
 
-def replace_into(engine: Engine, table: str, df: pd.DataFrame, chunk_size: int = 1000) -> int:
+def _clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise equivalent of applying _clean_scalar to every non-NA cell.
+    Returns an object-dtype frame holding SQL-safe Python values (None for NA).
+    """
+    cols = {}
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        if pd.api.types.is_bool_dtype(s.dtype):
+            s = s.astype("Int8")
+        elif pd.api.types.is_float_dtype(s.dtype):
+            s = s.where(np.isfinite(s.to_numpy(dtype="float64", na_value=np.nan)))
+        na_mask = s.isna().to_numpy()
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # Clean each category once and map the codes; the trailing None is what code -1 (NA) picks
+            lookup = np.array([_clean_scalar(c) for c in s.cat.categories] + [None], dtype=object)
+            values = lookup[s.cat.codes.to_numpy()]
+        else:
+            values = s.to_numpy(dtype=object)
+        if pd.api.types.is_string_dtype(s.dtype):
+            # Mixed Python objects (textual NaNs, numpy scalars) still need per-cell handling
+            values = values.copy()
+            for j in np.flatnonzero(~na_mask):
+                values[j] = _clean_scalar(values[j])
+        values[na_mask] = None
+        cols[i] = values
+    out = pd.DataFrame(cols, index=df.index, dtype=object)
+    out.columns = df.columns
+    return out
+
+
+def _iter_clean_rows(df: pd.DataFrame, block_size: int):
+    """Yield SQL-safe row tuples, cleaning block_size rows at a time."""
+    for i in range(0, len(df), block_size):
+        yield from _clean_frame(df.iloc[i:i+block_size]).itertuples(index=False, name=None)
+
+
+def upsert_into(engine: Engine, table: str, df: pd.DataFrame, chunk_size: int = 5000) -> int:
+    """
+    Upsert df into table with INSERT ... ON DUPLICATE KEY UPDATE.
+    Unlike REPLACE, conflicting rows are updated in place rather than deleted and re-inserted.
+    PyMySQL's executemany folds each chunk into a single multi-row VALUES statement.
+    """
     if df.empty:
         return 0
     cols = list(df.columns)
     placeholders = ", ".join(["%s"] * len(cols))
     col_sql = ", ".join(f"`{c}`" for c in cols)
-    sql = f"REPLACE INTO `{table}` ({col_sql}) VALUES ({placeholders})"
+    update_sql = ", ".join(f"`{c}`=VALUES(`{c}`)" for c in cols)
+    sql = f"INSERT INTO `{table}` ({col_sql}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {update_sql}"
     total = 0
     with engine.begin() as conn:
-        for i in range(0, len(df), chunk_size):
-            chunk_df = df.iloc[i:i+chunk_size]
-            # Build SQL-safe rows
-            rows = [tuple(_clean_value(x) for x in chunk_df.iloc[r].tolist()) for r in range(len(chunk_df))]
-            if not rows:
-                continue
-            conn.exec_driver_sql(sql, rows)
-            total += len(rows)
-            log.debug("REPLACE chunk table=%s rows=%s total_written=%s", table, len(rows), total)
-    log.info("REPLACE done table=%s rows_written=%s", table, total)
+        # One DBAPI cursor for every chunk instead of a fresh cursor per exec_driver_sql call
+        cursor = conn.connection.cursor()
+        try:
+            for rows in _chunk_iter(_iter_clean_rows(df, chunk_size), chunk_size):
+                cursor.executemany(sql, rows)
+                total += len(rows)
+                log.debug("UPSERT chunk table=%s rows=%s total_written=%s", table, len(rows), total)
+        finally:
+            cursor.close()
+    log.info("UPSERT done table=%s rows_written=%s", table, total)
     return total
 
 
+# MySQL's default LOAD DATA format: tab-separated, backslash escapes, \N for NULL
+_INFILE_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+def _infile_field(val) -> str:
+    if val is None:
+        return "\\N"
+    if isinstance(val, str):
+        return val.translate(_INFILE_ESCAPES)
+    return str(val)
+
+
+def bulk_load(engine: Engine, table: str, df: pd.DataFrame, chunk_size: int = 50000) -> int:
+    """
+    Load df via LOAD DATA LOCAL INFILE ... REPLACE on the raw PyMySQL connection.
+    Much faster than parameterized inserts for large frames (plays, pitches).
+    """
+    if df.empty:
+        return 0
+    col_sql = ", ".join(f"`{c}`" for c in df.columns)
+    sql = f"LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE `{table}` CHARACTER SET utf8mb4 ({col_sql})"
+    fd, path = tempfile.mkstemp(prefix=f"mlb_{table}_", suffix=".tsv")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            for row in _iter_clean_rows(df, chunk_size):
+                f.write("\t".join(map(_infile_field, row)))
+                f.write("\n")
+        raw = engine.raw_connection()
+        try:
+            cur = raw.cursor()
+            cur.execute(sql, (path,))
+            cur.close()
+            raw.commit()
+        finally:
+            raw.close()
+    finally:
+        os.remove(path)
+    log.info("LOAD DATA done table=%s rows_written=%s", table, len(df))
+    return int(len(df))
+
+
 DEFAULT_KEYS: Dict[str, List[str]] = {
     "sports": ["id"],
     "leagues": ["id"],
@@ -118,13 +244,21 @@ DEFAULT_KEYS: Dict[str, List[str]] = {
 }
 
 
+def _write_one(engine: Engine, name: str, df: pd.DataFrame) -> int:
+    if len(df) >= DB_BULK_MIN_ROWS and engine.dialect.name == "mysql":
+        try:
+            return bulk_load(engine, name, df)
+        except Exception as e:
+            log.warning("LOAD DATA failed table=%s (%s); falling back to upsert", name, e)
+    return upsert_into(engine, name, df)
+
+
 def write_tables_to_db(tables: Dict[str, pd.DataFrame], engine: Engine | None = None, keys: Dict[str, List[str]] | None = None) -> Dict[str, int]:
     engine = engine or get_engine()
     keys = keys or DEFAULT_KEYS
-    counts: Dict[str, int] = {}
-    for name, df in tables.items():
-        if df is None or df.empty:
-            continue
+    todo = {name: df for name, df in tables.items() if df is not None and not df.empty}
+    # DDL runs serially up front so concurrent writers never race on CREATE TABLE/INDEX
+    for name, df in todo.items():
         log.info("DB writing table=%s rows=%s cols=%s", name, df.shape[0], df.shape[1])
         try:
             ensure_table_exists(engine, name, df)
@@ -134,6 +268,9 @@ def write_tables_to_db(tables: Dict[str, pd.DataFrame], engine: Engine | None =
         if pk:
             idx_name = f"uniq_{name}_{'_'.join(pk)}"
             create_unique_index(engine, name, idx_name, pk)
-        written = replace_into(engine, name, df)
-        counts[name] = written
-    return counts
+    if not todo:
+        return {}
+    # Tables are independent; write them concurrently over the shared connection pool
+    with cf.ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(todo))) as ex:
+        futures = {name: ex.submit(_write_one, engine, name, df) for name, df in todo.items()}
+    return {name: fut.result() for name, fut in futures.items()}
@@ -1,40 +1,95 @@
 from __future__ import annotations
+import atexit
 import concurrent.futures as cf
+import itertools
 import logging
-from typing import Any, Dict, Iterable, List, Tuple, Optional
+import multiprocessing as mp
+import threading
+import warnings
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Optional
 from datetime import date, timedelta
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-from .config import DEFAULT_VER, GAME_FEED_VER, SPORT_ID, MAX_WORKERS
+from .config import DEFAULT_VER, GAME_FEED_VER, SPORT_ID, MAX_WORKERS, PARSE_WORKERS
 from .http_client import MLBClient
 from .parsers import parse_schedule_to_games, parse_game_feed
 from .progress import ProgressCallback
+from .utils import records_to_frame, shrink_dtypes, unique_int_ids
 
 log = logging.getLogger('mlb_stats_etl.extract')
 
+_PEOPLE_CHUNK = 100  # personIds per /people request
+_FEED_WINDOW = 4 * MAX_WORKERS  # game feeds in flight per fetch_game_feeds call
+# Raw /people records by person id; reused across seasons and runs within one process
+_PEOPLE_CACHE: Dict[int, Dict[str, Any]] = {}
+# Ids whose /people request is in flight, so concurrent seasons wait instead of refetching them
+_PEOPLE_PENDING: Dict[int, cf.Future] = {}
+_PEOPLE_LOCK = threading.Lock()
+
+
+_EXECUTOR: Optional[cf.ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> cf.ThreadPoolExecutor:
+    """Process-wide I/O pool shared by the fetch_* functions; created on first use."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = cf.ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="mlb-fetch")
+            atexit.register(_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+    return _EXECUTOR
+
+
+_PARSE_POOL: Optional[cf.ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> Optional[cf.ProcessPoolExecutor]:
+    """Process pool for the CPU-bound feed parsing when MLB_PARSE_WORKERS > 0, else None."""
+    global _PARSE_POOL
+    if PARSE_WORKERS <= 0:
+        return None
+    with _EXECUTOR_LOCK:
+        if _PARSE_POOL is None:
+            # spawn, not fork: the parent already runs fetch threads holding locks a forked child would inherit
+            _PARSE_POOL = cf.ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=mp.get_context("spawn"))
+            atexit.register(_PARSE_POOL.shutdown, wait=False, cancel_futures=True)
+    return _PARSE_POOL
+
 
 def _concat(dfs: Iterable[pd.DataFrame]) -> pd.DataFrame:
-    dfs = [df for df in dfs if df is not None and not df.empty]
+    dfs = [df for df in dfs if isinstance(df, pd.DataFrame) and not df.empty]
     if not dfs:
         return pd.DataFrame()
-    return pd.concat(dfs, ignore_index=True)
+    # pandas warns about all-NA columns changing the result dtype; that's expected here
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        return pd.concat(dfs, ignore_index=True, sort=False)
 
 
 def fetch_reference_frames(client: MLBClient, season: Optional[int]=None, on_progress: Optional[ProgressCallback]=None) -> Dict[str, pd.DataFrame]:
     if on_progress: on_progress('fetch_reference_frames:start', {"season": season})
-    sports = client.get(f"/{DEFAULT_VER}/sports")
+    params = {"sportId": SPORT_ID}
+    if season:
+        params["season"] = season
+    # The five endpoints are independent; fetch them concurrently
+    ex = get_executor()
+    f_sports = ex.submit(client.get, f"/{DEFAULT_VER}/sports")
+    f_leagues = ex.submit(client.get, f"/{DEFAULT_VER}/league")
+    f_divisions = ex.submit(client.get, f"/{DEFAULT_VER}/divisions")
+    f_venues = ex.submit(client.get, f"/{DEFAULT_VER}/venues")
+    f_teams = ex.submit(client.get, f"/{DEFAULT_VER}/teams", params=params)
+    sports = f_sports.result()
     sports_df = pd.json_normalize(sports.get("sports", []))
-    leagues = client.get(f"/{DEFAULT_VER}/league")
+    leagues = f_leagues.result()
     leagues_df = pd.json_normalize(leagues.get("leagues", []) or leagues.get("league", []))
-    divisions = client.get(f"/{DEFAULT_VER}/divisions")
+    divisions = f_divisions.result()
     divisions_df = pd.json_normalize(divisions.get("divisions", []))
-    venues = client.get(f"/{DEFAULT_VER}/venues")
+    venues = f_venues.result()
     venues_df = pd.json_normalize(venues.get("venues", []))
-    params = {"sportId": SPORT_ID}
-    if season:
-        params["season"] = season
-    teams = client.get(f"/{DEFAULT_VER}/teams", params=params)
+    teams = f_teams.result()
     teams_df = pd.json_normalize(teams.get("teams", []))
     out = {"sports": sports_df, "leagues": leagues_df, "divisions": divisions_df, "venues": venues_df, "teams": teams_df}
     log.info("Reference frames loaded sports=%s leagues=%s divisions=%s venues=%s teams=%s",
@@ -54,7 +109,7 @@ def fetch_seasons(client: MLBClient, sport_id: int=SPORT_ID, all_seasons: bool=T
     return df
 
 
-def fetch_team_roster_people(client: MLBClient, team_ids: List[int], season: int, on_progress: Optional[ProgressCallback]=None) -> pd.DataFrame:
+def fetch_team_roster_people(client: MLBClient, team_ids: Sequence[int], season: int, on_progress: Optional[ProgressCallback]=None) -> pd.DataFrame:
     people_rows: List[Dict[str, Any]] = []
 
     if on_progress: on_progress('rosters:start', {"teams": len(team_ids), "season": season})
@@ -72,40 +127,68 @@ def fetch_team_roster_people(client: MLBClient, team_ids: List[int], season: int
             })
         return rows
 
-    with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-        for rows in tqdm(ex.map(pull_one, team_ids), total=len(team_ids), desc=f"Rosters {season}"):
-            people_rows.extend(rows)
+    ex = get_executor()
+    for rows in tqdm(ex.map(pull_one, team_ids), total=len(team_ids), desc=f"Rosters {season}"):
+        people_rows.extend(rows)
 
     if on_progress: on_progress('rosters:fetched', {"rows": len(people_rows)})
     log.info("Rosters fetched season=%s people_rows=%s", season, len(people_rows))
-    df = pd.DataFrame.from_records(people_rows)
+    df = records_to_frame(people_rows)
     if df.empty:
         return df
     df = df.drop_duplicates(subset=["person_id"]).reset_index(drop=True)
-    person_ids = df["person_id"].dropna().astype(int).tolist()
-    person_dfs = []
-    CHUNK = 50
-    for i in tqdm(range(0, len(person_ids), CHUNK), desc="Hydrate people"):
-        chunk = person_ids[i:i+CHUNK]
-        pdata = client.get(f"/{DEFAULT_VER}/people", params={"personIds": ",".join(map(str, chunk))})
-        person_dfs.append(pd.json_normalize(pdata.get("people", [])))
-    people_details_df = pd.concat(person_dfs, ignore_index=True) if person_dfs else pd.DataFrame()
+    person_ids = unique_int_ids(df["person_id"])
+
+    def hydrate(ids: List[int]) -> None:
+        r = client.get(f"/{DEFAULT_VER}/people", params={"personIds": ",".join(map(str, ids))})
+        for person in r.get("people", []):
+            if person.get("id") is not None:
+                _PEOPLE_CACHE[int(person["id"])] = person
+
+    # Claim ids nobody has fetched or is fetching; ids another season already claimed are awaited
+    with _PEOPLE_LOCK:
+        missing = [pid for pid in person_ids if pid not in _PEOPLE_CACHE and pid not in _PEOPLE_PENDING]
+        waiting = {_PEOPLE_PENDING[pid] for pid in person_ids if pid in _PEOPLE_PENDING}
+        # Hydrate on the same pool instead of a serial tail after the rosters return
+        futures = []
+        for i in range(0, len(missing), _PEOPLE_CHUNK):
+            batch = missing[i:i+_PEOPLE_CHUNK]
+            fut = ex.submit(hydrate, batch)
+            futures.append(fut)
+            _PEOPLE_PENDING.update(dict.fromkeys(batch, fut))
+    try:
+        for f in tqdm(futures, desc="Hydrate people"):
+            f.result()
+    finally:
+        with _PEOPLE_LOCK:
+            for pid in missing:
+                _PEOPLE_PENDING.pop(pid, None)
+    for f in waiting:
+        f.result()  # a failed batch owned by another season fails this one too, not silently missing details
+    log.info("Rosters people cache season=%s hits=%s fetched=%s awaited_batches=%s",
+             season, len(person_ids) - len(missing), len(missing), len(waiting))
+    people_details_df = pd.json_normalize([_PEOPLE_CACHE[pid] for pid in person_ids if pid in _PEOPLE_CACHE])
     if on_progress: on_progress('rosters:hydrated', {"persons": len(person_ids), "details_rows": int(people_details_df.shape[0])})
     log.info("Rosters hydrated season=%s persons=%s details_rows=%s", season, len(person_ids), people_details_df.shape[0])
-    out = df.merge(people_details_df.add_prefix("person_"), left_on="person_id", right_on="person_id", how="left")
+    if "id" not in people_details_df.columns:
+        return df
+    # person_id is unique on both sides, so an index lookup beats a two-sided hash merge
+    rhs = people_details_df.drop_duplicates(subset=["id"]).add_prefix("person_").set_index("person_id")
+    out = df.join(rhs, on="person_id", how="left")
     log.info("Rosters merged season=%s rows=%s cols=%s", season, out.shape[0], out.shape[1])
     return out
 
 
-def fetch_schedule_gamepks(client: MLBClient, season: int, game_types: str="R,P", on_progress: Optional[ProgressCallback]=None) -> List[int]:
+def fetch_schedule_gamepks(client: MLBClient, season: int, game_types: str="R,P", on_progress: Optional[ProgressCallback]=None) -> np.ndarray:
     params = {"sportId": 1, "season": season, "gameTypes": game_types}
     sched = client.get(f"/{DEFAULT_VER}/schedule", params=params)
     games_df = parse_schedule_to_games(sched)
     if on_progress: on_progress('schedule:season', {"season": season, "games": int(games_df.shape[0])})
     if games_df is None or games_df.empty or "gamePk" not in games_df.columns:
         log.info("Schedule season=%s games=0 (no gamePk)", season)
-        return []
-    out = games_df["gamePk"].dropna().astype(int).tolist()
+        return unique_int_ids(None)
+    # Suspended/resumed games are listed on both dates; fetch each feed once
+    out = unique_int_ids(games_df["gamePk"])
     log.info("Schedule season=%s games=%s", season, len(out))
     return out
 
@@ -119,7 +202,7 @@ def fetch_schedule_by_dates(client: MLBClient, start_date: str, end_date: str, s
     return df
 
 
-def fetch_game_feeds(client: MLBClient, game_pks: List[int], on_progress: Optional[ProgressCallback]=None):
+def fetch_game_feeds(client: MLBClient, game_pks: Sequence[int], on_progress: Optional[ProgressCallback]=None):
     games_list=[]; line_list=[]; team_list=[]; player_list=[]; plays_list=[]; pitches_list=[]
 
     if on_progress: on_progress('game_feeds:start', {"count": len(game_pks)})
@@ -131,28 +214,56 @@ def fetch_game_feeds(client: MLBClient, game_pks: List[int], on_progress: Option
             r = client.get(f"/{DEFAULT_VER}/game/{gamePk}/feed/live")
         return r
 
-    with cf.ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
-        for gj in tqdm(ex.map(pull_one, game_pks), total=len(game_pks), desc="Games"):
-            g, l, t, p, plays, pitches = parse_game_feed(gj)
-            games_list.append(g); line_list.append(l); team_list.append(t); player_list.append(p); plays_list.append(plays); pitches_list.append(pitches)
-
-    def _concat_non_na(dfs: List[pd.DataFrame]) -> pd.DataFrame:
-        filtered = []
-        for d in dfs:
-            if d is None or not isinstance(d, pd.DataFrame) or d.empty:
-                continue
-            # skip frames that are entirely NA to avoid FutureWarning
-            if d.isna().all().all():
-                continue
-            filtered.append(d)
-        return pd.concat(filtered, ignore_index=True) if filtered else pd.DataFrame()
-
-    games_df = _concat_non_na(games_list)
-    lines_df = _concat_non_na(line_list)
-    gteams_df = _concat_non_na(team_list)
-    gplayers_df = _concat_non_na(player_list)
-    plays_df = _concat_non_na(plays_list)
-    pitches_df = _concat_non_na(pitches_list)
+    parsed: List[Optional[Tuple[pd.DataFrame, ...]]] = [None] * len(game_pks)
+    ex = get_executor()
+    parse_pool = get_parse_pool()
+    queue = iter(enumerate(game_pks))
+    pending: Dict[cf.Future, int] = {}
+    parsing: Dict[cf.Future, int] = {}
+
+    def submit(n: int) -> None:
+        for i, pk in itertools.islice(queue, n):
+            pending[ex.submit(pull_one, pk)] = i
+
+    # Keep a bounded window of feeds in flight rather than queueing the whole list: concurrent
+    # seasons then interleave on the shared pool, and undecoded payloads can't pile up
+    submit(_FEED_WINDOW)
+    try:
+        with tqdm(total=len(game_pks), desc="Games") as bar:
+            while pending or parsing:
+                done, _ = cf.wait([*pending, *parsing], return_when=cf.FIRST_COMPLETED)
+                fetched = 0
+                for fut in done:
+                    # Parse each feed as soon as it lands so parsing overlaps the remaining fetches;
+                    # results are slotted by position to keep the output in game_pks order
+                    if fut in parsing:
+                        parsed[parsing.pop(fut)] = fut.result()
+                        bar.update(1)
+                        continue
+                    fetched += 1
+                    i = pending.pop(fut)
+                    if parse_pool is not None:
+                        # parse_game_feed is pure-Python CPU work, so threads serialize on the GIL
+                        parsing[parse_pool.submit(parse_game_feed, fut.result())] = i
+                    else:
+                        parsed[i] = parse_game_feed(fut.result())
+                        bar.update(1)
+                submit(fetched)
+    except BaseException:
+        # The pools outlive this call, so drop the queued work instead of letting it run on
+        for fut in (*pending, *parsing):
+            fut.cancel()
+        raise
+    for g, l, t, p, plays, pitches in parsed:
+        games_list.append(g); line_list.append(l); team_list.append(t); player_list.append(p); plays_list.append(plays); pitches_list.append(pitches)
+
+    # Narrow dtypes once per batch: categories for repeated codes, smallest int widths
+    games_df = shrink_dtypes(_concat(games_list))
+    lines_df = shrink_dtypes(_concat(line_list))
+    gteams_df = shrink_dtypes(_concat(team_list))
+    gplayers_df = shrink_dtypes(_concat(player_list))
+    plays_df = shrink_dtypes(_concat(plays_list))
+    pitches_df = shrink_dtypes(_concat(pitches_list))
     log.info(
         "Game feeds done games=%s lines=%s game_teams=%s game_players=%s plays=%s pitches=%s",
         games_df.shape[0], lines_df.shape[0], gteams_df.shape[0], gplayers_df.shape[0], plays_df.shape[0], pitches_df.shape[0]
@@ -160,21 +271,44 @@ def fetch_game_feeds(client: MLBClient, game_pks: List[int], on_progress: Option
     return games_df, lines_df, gteams_df, gplayers_df, plays_df, pitches_df
 
 
+# Flattened json_normalize column -> output column
+_STANDINGS_COLUMNS = {
+    "record.league.id": "league_id",
+    "record.division.id": "division_id",
+    "team.id": "team_id",
+    "wins": "wins",
+    "losses": "losses",
+    "winningPercentage": "pct",
+    "runsScored": "runsScored",
+    "runsAllowed": "runsAllowed",
+    "streak.streakCode": "streak",
+}
+
+_TRANSACTION_COLUMNS = {
+    "id": "id",
+    "team.id": "team_id",
+    "date": "date",
+    "typeCode": "type",
+    "person.id": "player_id",
+    "person.fullName": "player_name",
+    "description": "description",
+    "effectiveDate": "effectiveDate",
+}
+
+
 def fetch_standings(client: MLBClient, season: int, league_ids: str="103,104", on_progress: Optional[ProgressCallback]=None) -> pd.DataFrame:
     params = {"leagueId": league_ids, "season": season}
     s = client.get(f"/{DEFAULT_VER}/standings", params=params)
-    recs = []
-    for rec in s.get("records", []):
-        div = rec.get("division", {}) or {}
-        for teamrec in rec.get("teamRecords", []):
-            row = {
-                "season": season, "league_id": rec.get("league", {}).get("id"), "division_id": div.get("id"),
-                "team_id": teamrec.get("team", {}).get("id"), "wins": teamrec.get("wins"), "losses": teamrec.get("losses"),
-                "pct": teamrec.get("winningPercentage"), "runsScored": teamrec.get("runsScored"),
-                "runsAllowed": teamrec.get("runsAllowed"), "streak": (teamrec.get("streak", {}) or {}).get("streakCode"),
-            }
-            recs.append(row)
-    df = pd.DataFrame.from_records(recs)
+    records = [rec for rec in s.get("records", []) if rec.get("teamRecords")]
+    df = pd.json_normalize(
+        records,
+        record_path="teamRecords",
+        meta=[["league", "id"], ["division", "id"]],
+        meta_prefix="record.",
+        errors="ignore",
+    )
+    df = df.reindex(columns=list(_STANDINGS_COLUMNS)).rename(columns=_STANDINGS_COLUMNS)
+    df.insert(0, "season", season)
     if on_progress: on_progress('standings:season', {"season": season, "rows": int(df.shape[0])})
     log.info("Standings season=%s rows=%s", season, df.shape[0])
     return df
@@ -185,18 +319,7 @@ def fetch_transactions(client: MLBClient, start_date: str, end_date: str, team_i
     if team_id:
         params["teamId"] = team_id
     t = client.get(f"/{DEFAULT_VER}/transactions", params=params)
-    rows = []
-    for tr in t.get("transactions", []):
-        rows.append({
-            "id": tr.get("id"),
-            "team_id": (tr.get("team", {}) or {}).get("id"),
-            "date": tr.get("date"),
-            "type": tr.get("typeCode"),
-            "player_id": (tr.get("person", {}) or {}).get("id"),
-            "player_name": (tr.get("person", {}) or {}).get("fullName"),
-            "description": tr.get("description"),
-            "effectiveDate": tr.get("effectiveDate"),
-        })
-    df = pd.DataFrame.from_records(rows)
+    df = pd.json_normalize(t.get("transactions", []))
+    df = df.reindex(columns=list(_TRANSACTION_COLUMNS)).rename(columns=_TRANSACTION_COLUMNS)
     log.info("Transactions start=%s end=%s rows=%s", start_date, end_date, df.shape[0])
     return df
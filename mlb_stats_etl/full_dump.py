@@ -1,11 +1,15 @@
 from __future__ import annotations
 import argparse
+import concurrent.futures as cf
 import json
 import logging
 import os
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .logging_utils import setup_logging
@@ -17,6 +21,7 @@ from .extract import (
     fetch_schedule_gamepks,
     fetch_game_feeds,
     fetch_standings,
+    get_executor,
 )
 from .stats import (
     fetch_leaderboards,
@@ -25,10 +30,18 @@ from .stats import (
 )
 from .db import get_engine, write_tables_to_db
 from .config import SPORT_ID
-from .utils import concat_into, write_tables_to_parquet, to_int_series
+from .utils import SeasonPartitionWriter, append_shard, concat_frames, concat_shards, write_tables_to_parquet, unique_int_ids
 
 log = logging.getLogger("mlb_stats_etl.full_dump")
 
+_MAX_SEASON_WORKERS = 8
+# Append-heavy game tables written as season partitions as each season finishes instead of held until the end
+STREAMED_TABLES = ("games", "linescores", "game_teams", "game_players", "plays", "pitches")
+LEADER_CATEGORIES = (
+    ("hitting", ["homeRuns", "hits", "runsBattedIn", "stolenBases", "onBasePercentage", "sluggingPercentage", "ops"]),
+    ("pitching", ["wins", "strikeOuts", "earnedRunAverage", "walksAndHitsPerInningPitched", "saves"]),
+)
+
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(
@@ -44,27 +57,103 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--out", type=str, default="")
     ap.add_argument("--write-db", action="store_true")
     ap.add_argument("--db-url", type=str, default="")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the local HTTP response cache for this run")
     ap.add_argument("--log-level", type=str, default=os.getenv("LOG_LEVEL", "INFO"))
     ap.add_argument("--log-json", action="store_true")
     return ap.parse_args()
 
 
-def _team_ids_from(teams_df: pd.DataFrame) -> List[int]:
+def _team_ids_from(teams_df: pd.DataFrame) -> np.ndarray:
     if teams_df is None or teams_df.empty:
-        return []
+        return unique_int_ids(None)
     for col in ("team_id", "id"):
         if col in teams_df.columns:
-            return to_int_series(teams_df[col]).tolist()
-    return []
+            return unique_int_ids(teams_df[col])
+    return unique_int_ids(None)
+
+
+def _submit_season_extras(client: MLBClient, season: int, args: argparse.Namespace) -> List[Tuple[str, str, cf.Future]]:
+    """Start the optional season-level fetches on the shared I/O pool; returns (table, label, future)."""
+    ex = get_executor()
+    extras: List[Tuple[str, str, cf.Future]] = []
+    if args.include_standings:
+        extras.append(("standings", "standings", ex.submit(fetch_standings, client, season=season)))
+    if args.include_leaderboards:
+        for group, cats in LEADER_CATEGORIES:
+            extras.append(("leaders_players", f"leaders {group}",
+                           ex.submit(fetch_leaderboards, client, season=season, categories=cats, stat_group=group)))
+    if args.include_player_stats:
+        extras.append(("player_stats_season", "player_stats", ex.submit(fetch_player_stats_season, client, season=season)))
+    if args.include_team_stats:
+        extras.append(("team_stats_season", "team_stats", ex.submit(fetch_team_stats_season, client, season=season)))
+    return extras
+
+
+def process_season(client: MLBClient, season: int, args: argparse.Namespace, team_ids: np.ndarray) -> Dict[str, List[pd.DataFrame]]:
+    """Fetch everything for one season and return its frames keyed by table name."""
+    shards: Dict[str, List[pd.DataFrame]] = {}
+    log.info("Season %s: start", season)
+    # Standings/leaders/season stats don't depend on the game feeds, so they run alongside them
+    extras = _submit_season_extras(client, season, args)
+    try:
+        _fetch_season_games(client, season, team_ids, shards)
+    except BaseException:
+        for _, _, fut in extras:
+            fut.cancel()
+        raise
+    for key, label, fut in extras:
+        df = fut.result()
+        log.info("Season %s: %s rows=%s", season, label, 0 if df is None else df.shape[0])
+        append_shard(shards, key, df)
+
+    log.info("Season %s: done tables=%s", season, len(shards))
+    return shards
+
+
+def _fetch_season_games(client: MLBClient, season: int, team_ids: np.ndarray, shards: Dict[str, List[pd.DataFrame]]) -> None:
+    """People, schedule and game feeds for one season, appended into shards."""
+    # People/rosters
+    log.info("Season %s: team_ids=%s", season, len(team_ids))
+    if len(team_ids):
+        people_df = fetch_team_roster_people(client, team_ids=team_ids, season=season)
+        log.info("Season %s: people rows fetched=%s", season, 0 if people_df is None else people_df.shape[0])
+        append_shard(shards, "people", people_df)
+
+    # Schedule and game feeds
+    gamepks = fetch_schedule_gamepks(client, season=season)
+    log.info("Season %s: schedule gamePks=%s", season, len(gamepks))
+    if len(gamepks):
+        games_df, lines_df, gteams_df, gplayers_df, plays_df, pitches_df = fetch_game_feeds(client, gamepks)
+        log.info(
+            "Season %s: feeds games=%s lines=%s game_teams=%s game_players=%s plays=%s pitches=%s",
+            season,
+            0 if games_df is None else games_df.shape[0],
+            0 if lines_df is None else lines_df.shape[0],
+            0 if gteams_df is None else gteams_df.shape[0],
+            0 if gplayers_df is None else gplayers_df.shape[0],
+            0 if plays_df is None else plays_df.shape[0],
+            0 if pitches_df is None else pitches_df.shape[0],
+        )
+        append_shard(shards, "games", games_df)
+        append_shard(shards, "linescores", lines_df)
+        append_shard(shards, "game_teams", gteams_df)
+        append_shard(shards, "game_players", gplayers_df)
+        append_shard(shards, "plays", plays_df)
+        append_shard(shards, "pitches", pitches_df)
 
 
 def main() -> Dict[str, pd.DataFrame]:
+    """Run the dump and return the tables held in memory.
+
+    With --out and without --write-db the game tables (STREAMED_TABLES) are written to Parquet
+    season by season and are not part of the returned dict; their row counts are in the summary.
+    """
     args = parse_args()
     setup_logging(args.log_level, args.log_json)
     log.info("Starting full dump: start_season=%s end_season=%s sport_id=%s include_standings=%s include_leaderboards=%s include_player_stats=%s include_team_stats=%s out=%s write_db=%s",
              args.start_season, args.end_season, args.sport_id, args.include_standings, args.include_leaderboards, args.include_player_stats, args.include_team_stats, args.out, args.write_db)
 
-    client = MLBClient()
+    client = MLBClient(cache_enabled=False) if args.no_cache else MLBClient()
     tables: Dict[str, pd.DataFrame] = {}
 
     # Reference frames (sports, leagues, divisions, venues, teams)
@@ -81,90 +170,45 @@ def main() -> Dict[str, pd.DataFrame]:
     log.info("Loaded seasons rows=%s", tables["seasons"].shape[0] if isinstance(tables.get("seasons"), pd.DataFrame) else 0)
 
     log.info("Processing seasons range %s-%s", args.start_season, args.end_season)
-    for season in range(args.start_season, args.end_season + 1):
-        log.info("Season %s: start", season)
-        # People/rosters
-        team_ids = _team_ids_from(tables.get("teams", pd.DataFrame()))
-        log.info("Season %s: team_ids=%s", season, len(team_ids))
-        if team_ids:
-            people_df = fetch_team_roster_people(client, team_ids=team_ids, season=season)
-            log.info("Season %s: people rows fetched=%s", season, 0 if people_df is None else people_df.shape[0])
-            concat_into(tables, "people", people_df)
-
-        # Schedule and game feeds
-        gamepks = fetch_schedule_gamepks(client, season=season)
-        log.info("Season %s: schedule gamePks=%s", season, len(gamepks))
-        if gamepks:
-            games_df, lines_df, gteams_df, gplayers_df, plays_df, pitches_df = fetch_game_feeds(client, gamepks)
-            log.info(
-                "Season %s: feeds games=%s lines=%s game_teams=%s game_players=%s plays=%s pitches=%s",
-                season,
-                0 if games_df is None else games_df.shape[0],
-                0 if lines_df is None else lines_df.shape[0],
-                0 if gteams_df is None else gteams_df.shape[0],
-                0 if gplayers_df is None else gplayers_df.shape[0],
-                0 if plays_df is None else plays_df.shape[0],
-                0 if pitches_df is None else pitches_df.shape[0],
-            )
-            concat_into(tables, "games", games_df)
-            concat_into(tables, "linescores", lines_df)
-            concat_into(tables, "game_teams", gteams_df)
-            concat_into(tables, "game_players", gplayers_df)
-            concat_into(tables, "plays", plays_df)
-            concat_into(tables, "pitches", pitches_df)
-
-        if args.include_standings:
-            st_df = fetch_standings(client, season=season)
-            log.info("Season %s: standings rows=%s", season, 0 if st_df is None else st_df.shape[0])
-            concat_into(tables, "standings", st_df)
-
-        if args.include_leaderboards:
-            for group, cats in (
-                ("hitting", [
-                    "homeRuns",
-                    "hits",
-                    "runsBattedIn",
-                    "stolenBases",
-                    "onBasePercentage",
-                    "sluggingPercentage",
-                    "ops",
-                ]),
-                ("pitching", [
-                    "wins",
-                    "strikeOuts",
-                    "earnedRunAverage",
-                    "walksAndHitsPerInningPitched",
-                    "saves",
-                ]),
-            ):
-                lb_df = fetch_leaderboards(client, season=season, categories=cats, stat_group=group)
-                log.info("Season %s: leaders %s rows=%s", season, group, 0 if lb_df is None else lb_df.shape[0])
-                concat_into(
-                    tables,
-                    "leaders_players",
-                    lb_df,
-                )
-
-        if args.include_player_stats:
-            ps_df = fetch_player_stats_season(client, season=season)
-            log.info("Season %s: player_stats rows=%s", season, 0 if ps_df is None else ps_df.shape[0])
-            concat_into(
-                tables,
-                "player_stats_season",
-                ps_df,
-            )
-
-        if args.include_team_stats:
-            ts_df = fetch_team_stats_season(client, season=season)
-            log.info("Season %s: team_stats rows=%s", season, 0 if ts_df is None else ts_df.shape[0])
-            concat_into(
-                tables,
-                "team_stats_season",
-                ts_df,
-            )
+    # Seasons are independent and network-bound, so run them concurrently on one shared client;
+    # per-season frames are collected and concatenated once after the loop
+    seasons = list(range(args.start_season, args.end_season + 1))
+    shards: Dict[str, List[pd.DataFrame]] = {}
+    # The teams reference frame is fetched once, so its ids are the same for every season
+    team_ids = _team_ids_from(tables.get("teams", pd.DataFrame()))
+    writers: Dict[str, SeasonPartitionWriter] = {}
+    if args.out:
+        writers = {name: SeasonPartitionWriter(Path(args.out) / name) for name in STREAMED_TABLES}
+    workers = max(1, min(_MAX_SEASON_WORKERS, len(seasons)))
+    with cf.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mlb-season") as ex:
+        # Seasons are consumed in order, keeping the concatenated tables ordered by season. The next
+        # season is only submitted once one is consumed, so at most `workers` seasons of frames are
+        # held at a time, finished-but-waiting ones included
+        todo = iter(seasons)
+        pending = deque((s, ex.submit(process_season, client, s, args, team_ids)) for s in islice(todo, workers))
+        while pending:
+            season, fut = pending.popleft()
+            season_shards = fut.result()
+            nxt = next(todo, None)
+            if nxt is not None:
+                pending.append((nxt, ex.submit(process_season, client, nxt, args, team_ids)))
+            for name, frames in season_shards.items():
+                if name in writers:
+                    writers[name].write(concat_frames(frames), season)
+                    # Only the DB write still needs the whole table in memory
+                    if not args.write_db:
+                        continue
+                shards.setdefault(name, []).extend(frames)
+            del season_shards
+
+    for w in writers.values():
+        w.close()
+    tables.update(concat_shards(shards))
 
     if args.out:
-        count = write_tables_to_parquet(Path(args.out), tables)
+        streamed = sum(1 for w in writers.values() if w.rows)
+        rest = {k: v for k, v in tables.items() if k not in writers}
+        count = streamed + write_tables_to_parquet(Path(args.out), rest, partition=True)
         log.info("Parquet write complete path=%s tables_written=%s", args.out, count)
         print(f"Wrote {count} tables to {args.out}/")
 
@@ -174,7 +218,8 @@ def main() -> Dict[str, pd.DataFrame]:
         log.info("DB upsert complete counts=%s", counts)
         print("DB upsert counts:", json.dumps(counts, indent=2))
 
-    summary = {k: int(v.shape[0]) if isinstance(v, pd.DataFrame) else 0 for k, v in tables.items()}
+    summary = {k: len(v) if isinstance(v, pd.DataFrame) else 0 for k, v in tables.items()}
+    summary.update({k: w.rows for k, w in writers.items() if k not in summary and w.rows})
     log.info("Run summary row_counts=%s", summary)
     print("Row counts:", json.dumps(summary, indent=2))
     return tables
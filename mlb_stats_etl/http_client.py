@@ -1,36 +1,87 @@
 from __future__ import annotations
-import time, logging
+import time, logging, threading
+from datetime import date
+from concurrent.futures import Future
+from urllib.parse import urlencode
 from typing import Any, Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
 import sqlite3
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from .config import BASE_URL, TIMEOUT_SECONDS, REQS_PER_SEC, CACHE_ENABLED, CACHE_PATH, CACHE_TTL_SECONDS
+from .state import FINAL_CODES
+from .config import BASE_URL, TIMEOUT_SECONDS, HTTP_POOL_SIZE, REQS_PER_SEC, REQS_BURST, CACHE_ENABLED, CACHE_PATH, CACHE_TTL_SECONDS
 
 try:
     import requests_cache
 except Exception:
     requests_cache = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 log = logging.getLogger("mlb_stats_etl.http")
 
 class RateLimiter:
-    def __init__(self, reqs_per_sec: float):
-        self.min_interval = 1.0 / max(reqs_per_sec, 0.1)
-        self.last_time = 0.0
+    """Thread-safe token bucket: bursts up to `burst` requests, then `reqs_per_sec` on average."""
+    def __init__(self, reqs_per_sec: float, burst: float=REQS_BURST):
+        self.rate = max(reqs_per_sec, 0.1)
+        self.capacity = max(burst, 1.0)
+        self.tokens = self.capacity
+        self.last_refill = time.perf_counter()
+        self._lock = threading.Lock()
 
     def wait(self):
-        now = time.perf_counter()
-        delta = now - self.last_time
-        if delta < self.min_interval:
-            time.sleep(self.min_interval - delta)
-        self.last_time = time.perf_counter()
+        with self._lock:
+            now = time.perf_counter()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Take the token now (possibly going negative) so concurrent callers queue up behind it
+            self.tokens -= 1.0
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that throttles only requests that actually go to the network.
+
+    requests-cache answers hits before the adapter is reached, so cached reads skip the limiter.
+    """
+    def __init__(self, limiter: RateLimiter, **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+
+    def send(self, request, **kwargs):
+        self.limiter.wait()
+        return super().send(request, **kwargs)
+
+def _is_immutable_request(params: Optional[Dict[str, Any]]) -> bool:
+    """Requests scoped to a finished season or a date window that ended before today won't change."""
+    params = params or {}
+    today = date.today()
+    season = params.get("season")
+    if season is not None and str(season).isdigit() and int(season) < today.year:
+        return True
+    end_date = params.get("endDate")
+    return bool(end_date) and str(end_date) < today.isoformat()
+
+
+def _is_final_feed(path: str, data: Dict[str, Any]) -> bool:
+    """Feed of a game in one of FINAL_CODES; postponed/cancelled/game-over feeds keep the normal TTL."""
+    if not path.endswith("/feed/live"):
+        return False
+    status = (data.get("gameData") or {}).get("status") or {}
+    return status.get("codedGameState") in FINAL_CODES
+
 
 class MLBClient:
-    def __init__(self, session: Optional[requests.Session]=None, reqs_per_sec: float=REQS_PER_SEC):
+    def __init__(self, session: Optional[requests.Session]=None, reqs_per_sec: float=REQS_PER_SEC, burst: float=REQS_BURST,
+                 cache_enabled: bool=CACHE_ENABLED):
         if session is not None:
             self.sess = session
         else:
-            if CACHE_ENABLED and requests_cache is not None:
+            if cache_enabled and requests_cache is not None:
                 self.sess = requests_cache.CachedSession(
                     cache_name=CACHE_PATH,
                     backend="sqlite",
@@ -40,7 +91,53 @@ class MLBClient:
                 )
             else:
                 self.sess = requests.Session()
-        self.limiter = RateLimiter(reqs_per_sec)
+        self.limiter = RateLimiter(reqs_per_sec, burst)
+        self._mount_limiter(self.sess)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _mount_limiter(self, sess: requests.Session) -> None:
+        # urllib3 keeps only pool_maxsize idle sockets per host (default 10) and discards the rest,
+        # so size it for every worker thread to reuse a warm keep-alive connection
+        adapter = RateLimitedAdapter(self.limiter, pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+        sess.mount("https://", adapter)
+        sess.mount("http://", adapter)
+
+    @staticmethod
+    def _decode(resp: requests.Response) -> Dict[str, Any]:
+        # orjson decodes large game feeds several times faster than the stdlib json behind resp.json()
+        if orjson is not None:
+            try:
+                return orjson.loads(resp.content)
+            except orjson.JSONDecodeError:
+                pass  # let resp.json() raise requests' JSONDecodeError, which the retry policy covers
+        return resp.json()
+
+    def get(self, path: str, params: Optional[Dict[str, Any]]=None, *, timeout: float=TIMEOUT_SECONDS) -> Dict[str, Any]:
+        """GET path and return decoded JSON; concurrent calls for the same request share one fetch.
+
+        Coalesced callers receive the same object, so treat the payload as read-only.
+        """
+        key = f"{path}?{urlencode(sorted((params or {}).items()))}"
+        with self._inflight_lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[key] = Future()
+        if not leader:
+            log.debug("GET coalesced with in-flight request key=%s", key)
+            return fut.result()
+        try:
+            data = self._get(path, params, timeout=timeout)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
     @retry(
         reraise=True,
@@ -48,21 +145,29 @@ class MLBClient:
         wait=wait_exponential(multiplier=0.5, min=0.5, max=8),
         retry=retry_if_exception_type((requests.RequestException,)),
     )
-    def get(self, path: str, params: Optional[Dict[str, Any]]=None, *, timeout: float=TIMEOUT_SECONDS) -> Dict[str, Any]:
+    def _get(self, path: str, params: Optional[Dict[str, Any]]=None, *, timeout: float=TIMEOUT_SECONDS) -> Dict[str, Any]:
         if not path.startswith("/"):
             path = "/" + path
         url = BASE_URL + path
-        self.limiter.wait()
         start = time.perf_counter()
+        cached_session = requests_cache is not None and isinstance(self.sess, requests_cache.CachedSession)
+        # Past seasons/windows never change, so keep them in the cache for good instead of CACHE_TTL_SECONDS
+        kwargs = {"expire_after": requests_cache.NEVER_EXPIRE} if cached_session and _is_immutable_request(params) else {}
         try:
-            resp = self.sess.get(url, params=params, timeout=timeout)
+            resp = self.sess.get(url, params=params, timeout=timeout, **kwargs)
         except sqlite3.Error as e:
             # If cache backend fails (e.g., corrupt SQLite file), disable cache and retry once
             log.warning("requests-cache backend error (%s); disabling cache and retrying GET %s", e.__class__.__name__, url)
             self.sess = requests.Session()
+            self._mount_limiter(self.sess)
+            cached_session = False
             resp = self.sess.get(url, params=params, timeout=timeout)
         elapsed_ms = int((time.perf_counter() - start) * 1000)
         cache_hit = bool(getattr(resp, 'from_cache', False))
         log.debug('GET %s params=%s cache_hit=%s status=%s elapsed_ms=%s', url, params, cache_hit, resp.status_code, elapsed_ms)
         resp.raise_for_status()
-        return resp.json()
+        data = self._decode(resp)
+        if cached_session and not cache_hit and _is_final_feed(path, data):
+            # A final game's feed is immutable too; re-store it without an expiry
+            self.sess.cache.save_response(resp, expires=None)
+        return data
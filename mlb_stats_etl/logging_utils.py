@@ -1,18 +1,37 @@
 from __future__ import annotations
 import logging, os, sys, json
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 class JsonFormatter(logging.Formatter):
+    _time_cache: Tuple[int, str] = (-1, "")
+
+    def _iso_time(self, created: float) -> str:
+        # Records arrive many per second; format each second's UTC timestamp only once
+        sec = int(created)
+        cached = self._time_cache
+        if cached[0] != sec:
+            cached = (sec, datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+            self._time_cache = cached
+        return cached[1]
+
     def format(self, record: logging.LogRecord) -> str:
         payload = {
             "level": record.levelname,
             "name": record.name,
             "msg": record.getMessage(),
-            "time": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
+            "time": self._iso_time(record.created),
             "pid": record.process,
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(payload).decode()
         return json.dumps(payload, ensure_ascii=False)
 
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import pandas as pd
+import pyarrow as pa
+
+from .utils import records_to_frame, rows_to_frame
 
 def _norm(d: Dict[str, Any], prefix: str="") -> Dict[str, Any]:
     out = {}
@@ -8,210 +11,315 @@ def _norm(d: Dict[str, Any], prefix: str="") -> Dict[str, Any]:
         out[f"{prefix}{k}"] = v
     return out
 
-def _get(d: Dict[str, Any], path: str, default=None):
-    cur = d
+def _make_getter(path: str) -> Callable[[Dict[str, Any]], Any]:
+    """Compile a literal dotted path into a lambda with the .get() chain inlined (no split/loop per call)."""
+    expr = "d"
     for part in path.split("."):
-        if isinstance(cur, dict) and part in cur:
-            cur = cur[part]
-        else:
-            return default
-    return cur
+        expr = f"({expr} or {{}}).get({part!r})"
+    return eval(compile(f"lambda d: {expr}", f"<getter {path}>", "eval"))
+
+_G_STATUS_ABSTRACT = _make_getter("status.abstractGameState")
+_G_STATUS_CODED = _make_getter("status.codedGameState")
+_G_STATUS_DETAILED = _make_getter("status.detailedState")
+_G_STATUS_ABSTRACT_CODE = _make_getter("status.abstractGameCode")
+_G_VENUE_ID = _make_getter("venue.id")
+_G_VENUE_NAME = _make_getter("venue.name")
+_G_HOME_TEAM_ID = _make_getter("teams.home.team.id")
+_G_HOME_TEAM_NAME = _make_getter("teams.home.team.name")
+_G_AWAY_TEAM_ID = _make_getter("teams.away.team.id")
+_G_AWAY_TEAM_NAME = _make_getter("teams.away.team.name")
+_G_BOX_TEAMS = _make_getter("boxscore.teams")
+_G_ALL_PLAYS = _make_getter("plays.allPlays")
+
+_LINESCORE_COLUMNS = (
+    "gamePk", "inning", "home_runs", "home_hits", "home_errors", "away_runs", "away_hits",
+    "away_errors",
+)
+_GAME_TEAM_COLUMNS = (
+    "gamePk", "side", "team_id", "team_name", "batters_total_ab", "batters_total_r",
+    "batters_total_h", "batters_total_hr", "batters_total_bb", "batters_total_so", "pitch_total_ip",
+    "pitch_total_r", "pitch_total_er", "pitch_total_so", "pitch_total_bb",
+)
+_GAME_PLAYER_COLUMNS = (
+    "gamePk", "side", "person_id", "person_fullName", "position_code", "position_type",
+    "batting_order", "batting_ab", "batting_r", "batting_h", "batting_hr", "batting_rbi",
+    "batting_bb", "batting_so", "batting_sb", "batting_avg", "batting_obp", "batting_slg",
+    "batting_ops", "pitching_ip", "pitching_r", "pitching_er", "pitching_bb", "pitching_so",
+    "pitching_hr", "pitching_era", "fielding_po", "fielding_a", "fielding_e",
+)
+_PLAY_COLUMNS = (
+    "gamePk", "playId", "atBatIndex", "halfInning", "inning", "startTime", "endTime", "isOut",
+    "hasReview", "event", "eventType", "description", "rbi", "awayScore", "homeScore", "pitcher_id",
+    "batter_id", "batSide", "pitchHand", "balls", "strikes", "outs",
+)
+_PITCH_COLUMNS = (
+    "gamePk", "playId", "eventIndex", "pitch_number", "call_code", "call_description", "type_code",
+    "type_description", "description", "fromCatcher", "startSpeed", "endSpeed", "strikeZoneTop",
+    "strikeZoneBottom", "coordinates_pX", "coordinates_pZ", "plateTime", "launchSpeed",
+    "launchAngle", "totalDistance", "trajectory", "hardness", "hitCoordinates_x",
+    "hitCoordinates_y",
+)
+
+# Declared Arrow types for the large per-event tables, so they are built without an inference pass
+_PLAY_TYPES = {
+    **dict.fromkeys(("gamePk", "atBatIndex", "inning", "rbi", "awayScore", "homeScore", "pitcher_id", "batter_id",
+                     "balls", "strikes", "outs"), pa.int64()),
+    **dict.fromkeys(("playId", "halfInning", "startTime", "endTime", "event", "eventType", "description",
+                     "batSide", "pitchHand"), pa.string()),
+    **dict.fromkeys(("isOut", "hasReview"), pa.bool_()),
+}
+_PITCH_TYPES = {
+    **dict.fromkeys(("gamePk", "eventIndex", "pitch_number"), pa.int64()),
+    **dict.fromkeys(("playId", "call_code", "call_description", "type_code", "type_description", "description",
+                     "trajectory", "hardness"), pa.string()),
+    **dict.fromkeys(("startSpeed", "endSpeed", "strikeZoneTop", "strikeZoneBottom", "coordinates_pX", "coordinates_pZ",
+                     "plateTime", "launchSpeed", "launchAngle", "totalDistance", "hitCoordinates_x",
+                     "hitCoordinates_y"), pa.float64()),
+}
 
 def parse_schedule_to_games(schedule_json: Dict[str, Any]) -> pd.DataFrame:
+    """One row per scheduled game; games without a gamePk are dropped so gamePk is always int64."""
     rows: List[Dict[str, Any]] = []
     for date_block in schedule_json.get("dates", []):
         for g in date_block.get("games", []):
+            pk = g.get("gamePk")
+            if pk is None:
+                continue
             rows.append({
-                "gamePk": g.get("gamePk"),
+                "gamePk": int(pk),
                 "gameGuid": g.get("gameGuid"),
                 "gameType": g.get("gameType"),
                 "season": g.get("season"),
                 "gameDate": g.get("gameDate"),
-                "status_abstractGameState": _get(g, "status.abstractGameState"),
-                "status_codedGameState": _get(g, "status.codedGameState"),
-                "status_detailedState": _get(g, "status.detailedState"),
-                "status_abstractGameCode": _get(g, "status.abstractGameCode"),
+                "status_abstractGameState": _G_STATUS_ABSTRACT(g),
+                "status_codedGameState": _G_STATUS_CODED(g),
+                "status_detailedState": _G_STATUS_DETAILED(g),
+                "status_abstractGameCode": _G_STATUS_ABSTRACT_CODE(g),
                 "doubleHeader": g.get("doubleHeader"),
                 "seriesDescription": g.get("seriesDescription"),
                 "isTie": g.get("isTie"),
                 "ifNecessary": g.get("ifNecessary"),
                 "ifNecessaryDescription": g.get("ifNecessaryDescription"),
-                "venue_id": _get(g, "venue.id"),
-                "venue_name": _get(g, "venue.name"),
-                "home_team_id": _get(g, "teams.home.team.id"),
-                "home_team_name": _get(g, "teams.home.team.name"),
-                "away_team_id": _get(g, "teams.away.team.id"),
-                "away_team_name": _get(g, "teams.away.team.name"),
+                "venue_id": _G_VENUE_ID(g),
+                "venue_name": _G_VENUE_NAME(g),
+                "home_team_id": _G_HOME_TEAM_ID(g),
+                "home_team_name": _G_HOME_TEAM_NAME(g),
+                "away_team_id": _G_AWAY_TEAM_ID(g),
+                "away_team_name": _G_AWAY_TEAM_NAME(g),
             })
-    return pd.DataFrame.from_records(rows)
+    return records_to_frame(rows)
+
+_EMPTY: Dict[str, Any] = {}
+
+def _key_person_id(key: str) -> Optional[int]:
+    """Person id from a boxscore players key ("ID660271"); only needed when person.id is missing."""
+    try:
+        return int(key[2:] if key.startswith("ID") else key)
+    except ValueError:
+        return None
+
+def _parse_plays(all_plays: List[Dict[str, Any]], gamePk: Any) -> Tuple[List[tuple], List[tuple]]:
+    """Flatten allPlays x playEvents into play and pitch row tuples (the parse hot loop).
+
+    Subtrees are resolved once per event and missing ones fall back to a shared empty dict,
+    so each pitch costs one .get() per leaf and no throwaway {} allocations."""
+    play_rows: List[tuple] = []
+    pitch_rows: List[tuple] = []
+    add_play = play_rows.append
+    add_pitch = pitch_rows.append
+    for p in all_plays:
+        play_id = p.get("playId")
+        about = p.get("about") or _EMPTY
+        matchup = p.get("matchup") or _EMPTY
+        result = p.get("result") or _EMPTY
+        counts = p.get("count") or _EMPTY
+        add_play((
+            gamePk,
+            play_id,
+            about.get("atBatIndex"),
+            about.get("halfInning"),
+            about.get("inning"),
+            about.get("startTime"),
+            about.get("endTime"),
+            about.get("isOut"),
+            about.get("hasReview"),
+            result.get("event"),
+            result.get("eventType"),
+            result.get("description"),
+            result.get("rbi"),
+            result.get("awayScore"),
+            result.get("homeScore"),
+            (matchup.get("pitcher") or _EMPTY).get("id"),
+            (matchup.get("batter") or _EMPTY).get("id"),
+            (matchup.get("batSide") or _EMPTY).get("code"),
+            (matchup.get("pitchHand") or _EMPTY).get("code"),
+            counts.get("balls"),
+            counts.get("strikes"),
+            counts.get("outs"),
+        ))
+        for ev in p.get("playEvents") or ():
+            if not ev.get("isPitch", False):
+                continue
+            det = ev.get("details") or _EMPTY
+            call = det.get("call") or _EMPTY
+            typ = det.get("type") or _EMPTY
+            pd_ = ev.get("pitchData") or _EMPTY
+            coords = pd_.get("coordinates") or _EMPTY
+            hc = ev.get("hitData") or _EMPTY
+            hc_coords = hc.get("coordinates") or _EMPTY
+            add_pitch((
+                gamePk, play_id,
+                ev.get("index"),
+                ev.get("pitchNumber"),
+                call.get("code"),
+                call.get("description"),
+                typ.get("code"),
+                typ.get("description"),
+                det.get("description"),
+                det.get("fromCatcher"),
+                pd_.get("startSpeed"),
+                pd_.get("endSpeed"),
+                pd_.get("strikeZoneTop"),
+                pd_.get("strikeZoneBottom"),
+                coords.get("pX"),
+                coords.get("pZ"),
+                pd_.get("plateTime"),
+                hc.get("launchSpeed"),
+                hc.get("launchAngle"),
+                hc.get("totalDistance"),
+                hc.get("trajectory"),
+                hc.get("hardness"),
+                hc_coords.get("coordX"),
+                hc_coords.get("coordY"),
+            ))
+    return play_rows, pitch_rows
 
 def parse_game_feed(game_json: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    gamePk = _get(game_json, "gameData.game.pk") or _get(game_json, "gamePk") or _get(game_json, "gameData.gamePk")
+    # Resolve each subtree once and read leaves with plain .get() rather than re-walking from the root per field
+    game_data = game_json.get("gameData") or _EMPTY
+    live_data = game_json.get("liveData") or _EMPTY
+    game = game_data.get("game") or _EMPTY
+    dt = game_data.get("datetime") or _EMPTY
+    status = game_data.get("status") or _EMPTY
+    venue = game_data.get("venue") or _EMPTY
+    teams = game_data.get("teams") or _EMPTY
+    home = teams.get("home") or _EMPTY
+    away = teams.get("away") or _EMPTY
+    weather = game_data.get("weather") or _EMPTY
+    scorer = game_data.get("officialScorer") or _EMPTY
+    gamePk = game.get("pk") or game_json.get("gamePk") or game_data.get("gamePk")
     game_row = {
         "gamePk": gamePk,
-        "season": _get(game_json, "gameData.game.season"),
-        "game_type": _get(game_json, "gameData.game.type"),
-        "game_datetime": _get(game_json, "gameData.datetime.dateTime"),
-        "game_startTimeTBD": _get(game_json, "gameData.datetime.startTimeTBD"),
-        "status_detailedState": _get(game_json, "gameData.status.detailedState"),
-        "status_codedGameState": _get(game_json, "gameData.status.codedGameState"),
-        "venue_id": _get(game_json, "gameData.venue.id"),
-        "venue_name": _get(game_json, "gameData.venue.name"),
-        "home_team_id": _get(game_json, "gameData.teams.home.id"),
-        "home_team_name": _get(game_json, "gameData.teams.home.name"),
-        "away_team_id": _get(game_json, "gameData.teams.away.id"),
-        "away_team_name": _get(game_json, "gameData.teams.away.name"),
-        "weather_condition": _get(game_json, "gameData.weather.condition"),
-        "weather_temp": _get(game_json, "gameData.weather.temp"),
-        "officialScorer_id": _get(game_json, "gameData.officialScorer.id"),
-        "officialScorer_name": _get(game_json, "gameData.officialScorer.fullName"),
+        "season": game.get("season"),
+        "game_type": game.get("type"),
+        "game_datetime": dt.get("dateTime"),
+        "game_startTimeTBD": dt.get("startTimeTBD"),
+        "status_detailedState": status.get("detailedState"),
+        "status_codedGameState": status.get("codedGameState"),
+        "venue_id": venue.get("id"),
+        "venue_name": venue.get("name"),
+        "home_team_id": home.get("id"),
+        "home_team_name": home.get("name"),
+        "away_team_id": away.get("id"),
+        "away_team_name": away.get("name"),
+        "weather_condition": weather.get("condition"),
+        "weather_temp": weather.get("temp"),
+        "officialScorer_id": scorer.get("id"),
+        "officialScorer_name": scorer.get("fullName"),
     }
-    games_df = pd.DataFrame([game_row]).drop_duplicates(subset=["gamePk"])
+    games_df = pd.DataFrame([game_row])
 
     lines = []
-    ls = _get(game_json, "liveData.linescore")
+    ls = live_data.get("linescore")
     if ls:
         innings = ls.get("innings", [])
         for idx, inn in enumerate(innings, start=1):
-            lines.append({
-                "gamePk": gamePk,
-                "inning": idx,
-                "home_runs": _get(inn, "home.runs"),
-                "home_hits": _get(inn, "home.hits"),
-                "home_errors": _get(inn, "home.errors"),
-                "away_runs": _get(inn, "away.runs"),
-                "away_hits": _get(inn, "away.hits"),
-                "away_errors": _get(inn, "away.errors"),
-            })
-    linescores_df = pd.DataFrame.from_records(lines)
+            h = inn.get("home") or _EMPTY
+            a = inn.get("away") or _EMPTY
+            lines.append((
+                gamePk,
+                idx,
+                h.get("runs"),
+                h.get("hits"),
+                h.get("errors"),
+                a.get("runs"),
+                a.get("hits"),
+                a.get("errors"),
+            ))
+    linescores_df = rows_to_frame(_LINESCORE_COLUMNS, lines)
 
+    box_teams = _G_BOX_TEAMS(live_data) or _EMPTY
     team_rows = []
     for side in ("home", "away"):
-        team_rows.append({
-            "gamePk": gamePk,
-            "side": side,
-            "team_id": _get(game_json, f"liveData.boxscore.teams.{side}.team.id"),
-            "team_name": _get(game_json, f"liveData.boxscore.teams.{side}.team.name"),
-            "batters_total_ab": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.batting.atBats"),
-            "batters_total_r": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.batting.runs"),
-            "batters_total_h": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.batting.hits"),
-            "batters_total_hr": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.batting.homeRuns"),
-            "batters_total_bb": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.batting.baseOnBalls"),
-            "batters_total_so": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.batting.strikeOuts"),
-            "pitch_total_ip": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.pitching.inningsPitched"),
-            "pitch_total_r": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.pitching.runs"),
-            "pitch_total_er": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.pitching.earnedRuns"),
-            "pitch_total_so": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.pitching.strikeOuts"),
-            "pitch_total_bb": _get(game_json, f"liveData.boxscore.teams.{side}.teamStats.pitching.baseOnBalls"),
-        })
-    game_teams_df = pd.DataFrame.from_records(team_rows)
+        bt = box_teams.get(side) or _EMPTY
+        team = bt.get("team") or _EMPTY
+        team_stats = bt.get("teamStats") or _EMPTY
+        bat = team_stats.get("batting") or _EMPTY
+        pit = team_stats.get("pitching") or _EMPTY
+        team_rows.append((
+            gamePk,
+            side,
+            team.get("id"),
+            team.get("name"),
+            bat.get("atBats"),
+            bat.get("runs"),
+            bat.get("hits"),
+            bat.get("homeRuns"),
+            bat.get("baseOnBalls"),
+            bat.get("strikeOuts"),
+            pit.get("inningsPitched"),
+            pit.get("runs"),
+            pit.get("earnedRuns"),
+            pit.get("strikeOuts"),
+            pit.get("baseOnBalls"),
+        ))
+    game_teams_df = rows_to_frame(_GAME_TEAM_COLUMNS, team_rows)
 
     player_rows = []
     for side in ("home", "away"):
-        players = _get(game_json, f"liveData.boxscore.teams.{side}.players") or {}
+        players = (box_teams.get(side) or _EMPTY).get("players") or _EMPTY
         for pid_str, pdata in players.items():
-            try:
-                pid = int(pid_str.replace("ID", ""))
-            except Exception:
-                pid = None
-            batting = _get(pdata, "stats.batting") or {}
-            pitching = _get(pdata, "stats.pitching") or {}
-            fielding = _get(pdata, "stats.fielding") or {}
-            row = {
-                "gamePk": gamePk, "side": side,
-                "person_id": _get(pdata, "person.id") or pid,
-                "person_fullName": _get(pdata, "person.fullName"),
-                "position_code": _get(pdata, "position.abbreviation"),
-                "position_type": _get(pdata, "position.type"),
-                "batting_order": _get(pdata, "battingOrder"),
-                "batting_ab": batting.get("atBats"),
-                "batting_r": batting.get("runs"),
-                "batting_h": batting.get("hits"),
-                "batting_hr": batting.get("homeRuns"),
-                "batting_rbi": batting.get("rbi"),
-                "batting_bb": batting.get("baseOnBalls"),
-                "batting_so": batting.get("strikeOuts"),
-                "batting_sb": batting.get("stolenBases"),
-                "batting_avg": batting.get("avg"),
-                "batting_obp": batting.get("obp"),
-                "batting_slg": batting.get("slg"),
-                "batting_ops": batting.get("ops"),
-                "pitching_ip": pitching.get("inningsPitched"),
-                "pitching_r": pitching.get("runs"),
-                "pitching_er": pitching.get("earnedRuns"),
-                "pitching_bb": pitching.get("baseOnBalls"),
-                "pitching_so": pitching.get("strikeOuts"),
-                "pitching_hr": pitching.get("homeRuns"),
-                "pitching_era": pitching.get("era"),
-                "fielding_po": fielding.get("putOuts"),
-                "fielding_a": fielding.get("assists"),
-                "fielding_e": fielding.get("errors"),
-            }
+            person = pdata.get("person") or _EMPTY
+            pid = person.get("id") or _key_person_id(pid_str)
+            position = pdata.get("position") or _EMPTY
+            stats = pdata.get("stats") or _EMPTY
+            batting = stats.get("batting") or _EMPTY
+            pitching = stats.get("pitching") or _EMPTY
+            fielding = stats.get("fielding") or _EMPTY
+            row = (
+                gamePk, side,
+                pid,
+                person.get("fullName"),
+                position.get("abbreviation"),
+                position.get("type"),
+                pdata.get("battingOrder"),
+                batting.get("atBats"),
+                batting.get("runs"),
+                batting.get("hits"),
+                batting.get("homeRuns"),
+                batting.get("rbi"),
+                batting.get("baseOnBalls"),
+                batting.get("strikeOuts"),
+                batting.get("stolenBases"),
+                batting.get("avg"),
+                batting.get("obp"),
+                batting.get("slg"),
+                batting.get("ops"),
+                pitching.get("inningsPitched"),
+                pitching.get("runs"),
+                pitching.get("earnedRuns"),
+                pitching.get("baseOnBalls"),
+                pitching.get("strikeOuts"),
+                pitching.get("homeRuns"),
+                pitching.get("era"),
+                fielding.get("putOuts"),
+                fielding.get("assists"),
+                fielding.get("errors"),
+            )
             player_rows.append(row)
-    game_players_df = pd.DataFrame.from_records(player_rows)
+    game_players_df = rows_to_frame(_GAME_PLAYER_COLUMNS, player_rows)
 
-    play_rows, pitch_rows = [], []
-    all_plays = _get(game_json, "liveData.plays.allPlays") or []
-    for p in all_plays:
-        play_id = p.get("playId")
-        about = _get(p, "about") or {}
-        matchup = _get(p, "matchup") or {}
-        result = _get(p, "result") or {}
-        counts = _get(p, "count") or {}
-        play_rows.append({
-            "gamePk": gamePk,
-            "playId": play_id,
-            "atBatIndex": about.get("atBatIndex"),
-            "halfInning": about.get("halfInning"),
-            "inning": about.get("inning"),
-            "startTime": about.get("startTime"),
-            "endTime": about.get("endTime"),
-            "isOut": about.get("isOut"),
-            "hasReview": about.get("hasReview"),
-            "event": result.get("event"),
-            "eventType": result.get("eventType"),
-            "description": result.get("description"),
-            "rbi": result.get("rbi"),
-            "awayScore": result.get("awayScore"),
-            "homeScore": result.get("homeScore"),
-            "pitcher_id": matchup.get("pitcher", {}).get("id"),
-            "batter_id": matchup.get("batter", {}).get("id"),
-            "batSide": matchup.get("batSide", {}).get("code"),
-            "pitchHand": matchup.get("pitchHand", {}).get("code"),
-            "balls": counts.get("balls"),
-            "strikes": counts.get("strikes"),
-            "outs": counts.get("outs"),
-        })
-        for ev in p.get("playEvents", []):
-            if ev.get("isPitch", False):
-                det = ev.get("details", {}) or {}
-                pd_ = ev.get("pitchData", {}) or {}
-                hc = ev.get("hitData", {}) or {}
-                pitch_rows.append({
-                    "gamePk": gamePk, "playId": play_id,
-                    "eventIndex": ev.get("index"),
-                    "pitch_number": ev.get("pitchNumber"),
-                    "call_code": det.get("call", {}).get("code"),
-                    "call_description": det.get("call", {}).get("description"),
-                    "type_code": det.get("type", {}).get("code"),
-                    "type_description": det.get("type", {}).get("description"),
-                    "description": det.get("description"),
-                    "fromCatcher": det.get("fromCatcher"),
-                    "startSpeed": pd_.get("startSpeed"),
-                    "endSpeed": pd_.get("endSpeed"),
-                    "strikeZoneTop": pd_.get("strikeZoneTop"),
-                    "strikeZoneBottom": pd_.get("strikeZoneBottom"),
-                    "coordinates_pX": pd_.get("coordinates", {}).get("pX"),
-                    "coordinates_pZ": pd_.get("coordinates", {}).get("pZ"),
-                    "plateTime": pd_.get("plateTime"),
-                    "launchSpeed": hc.get("launchSpeed"),
-                    "launchAngle": hc.get("launchAngle"),
-                    "totalDistance": hc.get("totalDistance"),
-                    "trajectory": hc.get("trajectory"),
-                    "hardness": hc.get("hardness"),
-                    "hitCoordinates_x": hc.get("coordinates", {}).get("coordX"),
-                    "hitCoordinates_y": hc.get("coordinates", {}).get("coordY"),
-                })
-    plays_df = pd.DataFrame.from_records(play_rows)
-    pitches_df = pd.DataFrame.from_records(pitch_rows)
+    play_rows, pitch_rows = _parse_plays(_G_ALL_PLAYS(live_data) or [], gamePk)
+    plays_df = rows_to_frame(_PLAY_COLUMNS, play_rows, _PLAY_TYPES)
+    pitches_df = rows_to_frame(_PITCH_COLUMNS, pitch_rows, _PITCH_TYPES)
     return games_df, linescores_df, game_teams_df, game_players_df, plays_df, pitches_df
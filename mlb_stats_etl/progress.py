@@ -11,12 +11,11 @@ class Progress:
         self.log = logger or logging.getLogger("mlb_stats_etl.progress")
 
     def emit(self, event: str, payload: Optional[Dict[str, Any]] = None, **payload_kwargs: Any) -> None:
-        # Accept both positional dict payload and keyword args; merge into a single dict
-        merged: Dict[str, Any] = {}
-        if payload:
-            merged.update(payload)
-        if payload_kwargs:
-            merged.update(payload_kwargs)
+        # Accept both positional dict payload and keyword args; only build a merged dict when both are given
+        if payload and payload_kwargs:
+            merged: Dict[str, Any] = {**payload, **payload_kwargs}
+        else:
+            merged = payload_kwargs or payload or {}
         if self.callback:
             try:
                 self.callback(event, merged)
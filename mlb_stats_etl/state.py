@@ -1,26 +1,57 @@
 from __future__ import annotations
 import json, os, time
-from typing import Dict, Any, Set
+from typing import Dict, Any
+import numpy as np
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# codedGameState values for games whose stats can no longer change (Final, Final: tied, ...).
+# Postponed (D), Cancelled (C) and Game Over (O) also report abstractGameState "Final" but are left
+# out: a postponed game keeps its gamePk when it is made up, and Game Over precedes the final stats.
+FINAL_CODES = ("F", "FR", "FT")
+
+def _pks_path(path: str) -> str:
+    """Sidecar file holding final_game_pks as raw little-endian int64 (mlb_state.json -> mlb_state.final_pks.bin)."""
+    return os.path.splitext(path)[0] + ".final_pks.bin"
 
 def load_state(path: str) -> Dict[str, Any]:
     if not os.path.exists(path):
-        return {"final_game_pks": [], "last_daily_run": None, "last_window": None}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        state = {"final_game_pks": [], "last_daily_run": None, "last_window": None}
+    else:
+        with open(path, "rb") as f:
+            raw = f.read()
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    # Older state files keep the pks inline in the JSON; the sidecar wins once it exists
+    pks_path = _pks_path(path)
+    if os.path.exists(pks_path):
+        state["final_game_pks"] = np.fromfile(pks_path, dtype="<i8").astype(np.int64, copy=False)
+    return state
 
 def save_state(path: str, state: Dict[str, Any]) -> None:
+    pks_path = _pks_path(path)
+    tmp = pks_path + ".tmp"
+    get_final_game_pks(state).astype("<i8", copy=False).tofile(tmp)
+    os.replace(tmp, pks_path)
+    header = {k: v for k, v in state.items() if k != "final_game_pks"}
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2, sort_keys=True)
+        json.dump(header, f, indent=2, sort_keys=True)
     os.replace(tmp, path)
 
-def get_final_game_pks(state: Dict[str, Any]) -> Set[int]:
-    return set(int(x) for x in state.get("final_game_pks", []) if x is not None)
+def get_final_game_pks(state: Dict[str, Any]) -> np.ndarray:
+    """Known-final gamePks as a sorted, unique int64 array (for np.isin filtering)."""
+    pks = state.get("final_game_pks", [])
+    if isinstance(pks, np.ndarray):
+        return pks  # loaded from the sidecar or set by add_final_game_pks: already sorted and unique
+    # Legacy inline list: the decoder already produced ints, so convert in one call instead of int() per item
+    return np.unique(np.array([x for x in pks if x is not None], dtype=np.int64))
 
 def add_final_game_pks(state: Dict[str, Any], new_pks) -> None:
-    cur = get_final_game_pks(state)
-    cur.update(int(x) for x in new_pks if x is not None)
-    state["final_game_pks"] = sorted(cur)
+    new = np.fromiter((int(x) for x in new_pks if x is not None), dtype=np.int64)
+    state["final_game_pks"] = np.union1d(get_final_game_pks(state), new)
 
 def mark_daily_run(state: Dict[str, Any], start_date: str, end_date: str) -> None:
     state["last_daily_run"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
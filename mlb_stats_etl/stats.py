@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import pandas as pd
 from .config import DEFAULT_VER, SPORT_ID
 from .progress import ProgressCallback
 from .http_client import MLBClient
+from .utils import columns_to_frame, rows_to_frame
 
 log = logging.getLogger('mlb_stats_etl.stats')
 
+_LEADER_COLUMNS = ("season", "stat_group", "category", "rank", "value", "person_id", "player_fullName", "team_id", "team_name")
+
 
 def fetch_leaderboards(client: MLBClient, season: int, categories: List[str], stat_group: str="hitting", player_pool: str="ALL", limit: int=100, on_progress: Optional[ProgressCallback]=None) -> pd.DataFrame:
     if on_progress: on_progress('leaders:start', {"season": season, "group": stat_group, "categories": categories})
@@ -27,23 +30,29 @@ def fetch_leaderboards(client: MLBClient, season: int, categories: List[str], st
             for leader in cat_obj.get("leaders", []):
                 person = (leader.get("person") or {})
                 team = (leader.get("team") or {})
-                rows.append({
-                    "season": season,
-                    "stat_group": stat_group,
-                    "category": cat,
-                    "rank": leader.get("rank"),
-                    "value": leader.get("value"),
-                    "person_id": person.get("id"),
-                    "player_fullName": person.get("fullName"),
-                    "team_id": team.get("id"),
-                    "team_name": team.get("name"),
-                })
-    df = pd.DataFrame.from_records(rows)
+                rows.append((
+                    season, stat_group, cat, leader.get("rank"), leader.get("value"),
+                    person.get("id"), person.get("fullName"), team.get("id"), team.get("name"),
+                ))
+    df = rows_to_frame(_LEADER_COLUMNS, rows)
     if on_progress: on_progress('leaders:done', {"season": season, "group": stat_group, "rows": int(df.shape[0])})
     log.info("Leaderboards season=%s group=%s categories=%s rows=%s", season, stat_group, categories, df.shape[0])
     return df
 
 
+def _splits_frame(base: Dict[str, List[Any]], stats: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Frame of the fixed split columns plus one column per stat key, built column-wise.
+
+    Stat keys are homogeneous within a group, so the union is collected once and each column
+    is a single list comprehension instead of a dict per split."""
+    if not stats:
+        return pd.DataFrame()
+    cols = dict(base)
+    for k in dict.fromkeys(k for s in stats for k in s):
+        cols[k] = [s.get(k) for s in stats]
+    return columns_to_frame(cols)
+
+
 def fetch_player_stats_season(client: MLBClient, season: int, groups: List[str]=["hitting", "pitching", "fielding"], stats: str="season", game_type: str="R", on_progress: Optional[ProgressCallback]=None) -> pd.DataFrame:
     if on_progress: on_progress('player_stats:start', {"season": season, "groups": groups})
     if on_progress: on_progress('team_stats:start', {"season": season, "groups": groups})
@@ -51,15 +60,15 @@ def fetch_player_stats_season(client: MLBClient, season: int, groups: List[str]=
     for grp in groups:
         params = {"stats": stats, "group": grp, "season": season, "sportIds": SPORT_ID, "gameType": game_type, "playerPool": "ALL", "limit": 5000}
         data = client.get(f"/{DEFAULT_VER}/stats", params=params)
-        recs = []
-        for row in data.get("stats", []):
-            for s in row.get("splits", []):
-                player = (s.get("player") or {}); team = (s.get("team") or {}); stat = (s.get("stat") or {})
-                rec = {"season": season, "group": grp, "person_id": player.get("id"), "player_fullName": player.get("fullName"),
-                       "team_id": team.get("id"), "team_name": team.get("name")}
-                for k, v in (stat or {}).items(): rec[k] = v
-                recs.append(rec)
-        df = pd.DataFrame.from_records(recs)
+        splits = [s for row in data.get("stats", []) for s in row.get("splits", [])]
+        players = [s.get("player") or {} for s in splits]
+        teams = [s.get("team") or {} for s in splits]
+        n = len(splits)
+        df = _splits_frame({
+            "season": [season] * n, "group": [grp] * n,
+            "person_id": [p.get("id") for p in players], "player_fullName": [p.get("fullName") for p in players],
+            "team_id": [t.get("id") for t in teams], "team_name": [t.get("name") for t in teams],
+        }, [s.get("stat") or {} for s in splits])
         log.info("Player stats season=%s group=%s rows=%s", season, grp, df.shape[0])
         dfs.append(df)
     out = pd.concat([df for df in dfs if not df.empty], ignore_index=True) if dfs else pd.DataFrame()
@@ -75,14 +84,13 @@ def fetch_team_stats_season(client: MLBClient, season: int, groups: List[str]=["
     for grp in groups:
         params = {"season": season, "group": grp, "stats": stats, "sportIds": SPORT_ID, "gameType": game_type}
         data = client.get(f"/{DEFAULT_VER}/teams/stats", params=params)
-        recs = []
-        for row in data.get("stats", []):
-            for split in row.get("splits", []):
-                team = (split.get("team") or {}); stat = (split.get("stat") or {})
-                rec = {"season": season, "group": grp, "team_id": team.get("id"), "team_name": team.get("name")}
-                for k, v in (stat or {}).items(): rec[k] = v
-                recs.append(rec)
-        df = pd.DataFrame.from_records(recs)
+        splits = [s for row in data.get("stats", []) for s in row.get("splits", [])]
+        teams = [s.get("team") or {} for s in splits]
+        n = len(splits)
+        df = _splits_frame({
+            "season": [season] * n, "group": [grp] * n,
+            "team_id": [t.get("id") for t in teams], "team_name": [t.get("name") for t in teams],
+        }, [s.get("stat") or {} for s in splits])
         log.info("Team stats season=%s group=%s rows=%s", season, grp, df.shape[0])
         dfs.append(df)
     out = pd.concat([df for df in dfs if not df.empty], ignore_index=True) if dfs else pd.DataFrame()
@@ -5,8 +5,9 @@ import logging
 import os
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
 from .logging_utils import setup_logging
@@ -16,10 +17,10 @@ from .extract import (
     fetch_schedule_by_dates,
     fetch_game_feeds,
 )
-from .state import load_state, save_state, get_final_game_pks, add_final_game_pks, mark_daily_run
+from .state import FINAL_CODES, load_state, save_state, get_final_game_pks, add_final_game_pks, mark_daily_run
 from .db import get_engine, write_tables_to_db
 from .config import STATE_PATH
-from .utils import concat_into, write_tables_to_parquet
+from .utils import append_shard, concat_shards, unique_int_ids, write_tables_to_parquet
 
 log = logging.getLogger("mlb_stats_etl.update_daily")
 
@@ -31,30 +32,34 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--out", type=str, default="")
     ap.add_argument("--write-db", action="store_true")
     ap.add_argument("--db-url", type=str, default="")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the local HTTP response cache for this run")
     ap.add_argument("--log-level", type=str, default=os.getenv("LOG_LEVEL", "INFO"))
     ap.add_argument("--log-json", action="store_true")
     return ap.parse_args()
 
 
-def _detect_newly_final(games_df: pd.DataFrame) -> Set[int]:
+def _detect_newly_final(games_df: pd.DataFrame) -> np.ndarray:
     if games_df is None or games_df.empty or "gamePk" not in games_df.columns:
-        return set()
-    for col in ("status_codedGameState", "status_detailedState", "status_abstractGameState"):
-        if col in games_df.columns:
-            return set(
-                games_df.loc[
-                    games_df[col].astype(str).str.lower().str.contains("final"),
-                    "gamePk",
-                ].dropna().astype(int).tolist()
-            )
-    return set()
+        return unique_int_ids(None)
+    if "status_codedGameState" in games_df.columns:
+        # Low-cardinality categorical; isin matches on the category codes, no per-row string work
+        mask = games_df["status_codedGameState"].isin(FINAL_CODES)
+    else:
+        for col in ("status_detailedState", "status_abstractGameState"):
+            if col in games_df.columns:
+                mask = games_df[col].astype(str).str.contains("final", case=False, regex=False)
+                break
+        else:
+            return unique_int_ids(None)
+    # Schedule and feed rows both list each game; unique_int_ids dedups and skips NA in one pass
+    return unique_int_ids(games_df.loc[mask, "gamePk"])
 
 
 def main() -> Dict[str, pd.DataFrame]:
     args = parse_args()
     setup_logging(args.log_level, args.log_json)
 
-    client = MLBClient()
+    client = MLBClient(cache_enabled=False) if args.no_cache else MLBClient()
     today = date.today()
     start = today - timedelta(days=args.lookback_days)
     end = today + timedelta(days=args.lookahead_days)
@@ -73,18 +78,19 @@ def main() -> Dict[str, pd.DataFrame]:
         if isinstance(df, pd.DataFrame):
             log.info("Loaded reference %s rows=%s cols=%s", name, df.shape[0], df.shape[1])
 
+    # Game tables are collected as shards and concatenated once, after the feeds are in
+    shards: Dict[str, List[pd.DataFrame]] = {}
     games = fetch_schedule_by_dates(client, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
-    if isinstance(games, pd.DataFrame) and not games.empty:
-        tables["games"] = games
+    append_shard(shards, "games", games)
     log.info("Schedule window games rows=%s", 0 if games is None else games.shape[0])
 
     # Pull feeds for gamePks in the window, skip ones already known final
-    game_pks = []
+    game_pks = unique_int_ids(None)
     if isinstance(games, pd.DataFrame) and not games.empty and "gamePk" in games.columns:
-        game_pks = games["gamePk"].dropna().astype(int).tolist()
-    to_fetch = [pk for pk in game_pks if pk not in known_final]
+        game_pks = unique_int_ids(games["gamePk"])
+    to_fetch = game_pks[~np.isin(game_pks, known_final, assume_unique=True)]
     log.info("GamePks total=%s to_fetch=%s skipped_known_final=%s", len(game_pks), len(to_fetch), len(game_pks) - len(to_fetch))
-    if to_fetch:
+    if len(to_fetch):
         g_df, l_df, gt_df, gp_df, plays_df, pitches_df = fetch_game_feeds(client, to_fetch)
         log.info(
             "Feeds fetched: games=%s lines=%s game_teams=%s game_players=%s plays=%s pitches=%s",
@@ -95,12 +101,13 @@ def main() -> Dict[str, pd.DataFrame]:
             0 if plays_df is None else plays_df.shape[0],
             0 if pitches_df is None else pitches_df.shape[0],
         )
-        concat_into(tables, "games", g_df)
-        concat_into(tables, "linescores", l_df)
-        concat_into(tables, "game_teams", gt_df)
-        concat_into(tables, "game_players", gp_df)
-        concat_into(tables, "plays", plays_df)
-        concat_into(tables, "pitches", pitches_df)
+        append_shard(shards, "games", g_df)
+        append_shard(shards, "linescores", l_df)
+        append_shard(shards, "game_teams", gt_df)
+        append_shard(shards, "game_players", gp_df)
+        append_shard(shards, "plays", plays_df)
+        append_shard(shards, "pitches", pitches_df)
+    tables.update(concat_shards(shards))
 
     newly_final = _detect_newly_final(tables.get("games", pd.DataFrame()))
     log.info("Newly final detected count=%s", len(newly_final))
@@ -116,12 +123,13 @@ def main() -> Dict[str, pd.DataFrame]:
         log.info("DB upsert complete counts=%s", counts)
         print("DB upsert counts:", json.dumps(counts, indent=2))
 
-    add_final_game_pks(state, newly_final)
+    if len(newly_final):
+        add_final_game_pks(state, newly_final)
     mark_daily_run(state, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
     save_state(STATE_PATH, state)
     log.info("State saved path=%s final_game_pks=%s", STATE_PATH, len(get_final_game_pks(state)))
 
-    summary = {k: int(v.shape[0]) for k, v in tables.items()}
+    summary = {k: len(v) for k, v in tables.items()}
     log.info("Run summary row_counts=%s", summary)
     print("Row counts:", json.dumps(summary, indent=2))
     return tables
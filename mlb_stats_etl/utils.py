@@ -1,38 +1,266 @@
 from __future__ import annotations
+import concurrent.futures as cf
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import logging
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pandas.api.types import union_categoricals
 
 log = logging.getLogger("mlb_stats_etl.utils")
 
+# zstd with dictionary-encoded pages and large row groups; categorical columns are written as dictionaries
+PARQUET_OPTIONS = dict(
+    compression="zstd",
+    compression_level=3,
+    use_dictionary=True,
+    data_page_size=1 << 20,
+    write_statistics=True,
+)
+# Rows per Parquet row group for every writer: big enough for efficient zstd/dictionary pages,
+# small enough that season/column-statistics pruning can skip most of a large table
+PARQUET_ROW_GROUP_ROWS = 128 * 1024
 
-def concat_into(tables: Dict[str, pd.DataFrame], key: str, df: Optional[pd.DataFrame]) -> None:
-    """Append a DataFrame into tables[key], creating the key if needed; ignore None/empty."""
+
+# Known low-cardinality columns stored as category regardless of how many rows a batch has
+CAT_COLUMNS: Dict[str, tuple] = {
+    "games": ("season", "game_type", "gameType", "status_detailedState", "status_codedGameState", "status_abstractGameState",
+              "status_abstractGameCode", "doubleHeader", "seriesDescription", "ifNecessaryDescription",
+              "venue_name", "home_team_name", "away_team_name", "weather_condition"),
+    "game_teams": ("side", "team_name"),
+    "game_players": ("side", "position_code", "position_type"),
+    "plays": ("halfInning", "event", "eventType", "batSide", "pitchHand"),
+    "pitches": ("call_code", "call_description", "type_code", "type_description", "description", "trajectory", "hardness"),
+    "people": ("position_code", "position_type", "rosterStatus"),
+}
+
+
+def _categorize(df: pd.DataFrame, cols) -> pd.DataFrame:
+    """Cast the given columns (when present and string-typed) to category, in place."""
+    for c in cols:
+        if c in df.columns and pd.api.types.is_string_dtype(df[c].dtype):
+            df[c] = df[c].astype("category")
+    return df
+
+
+def records_to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a DataFrame from row dicts column-wise through Arrow (much faster type inference
+    than pandas' per-row constructor); falls back to from_records for mixed-type columns."""
+    if not rows:
+        return pd.DataFrame()
+    names = list(dict.fromkeys(k for r in rows for k in r))
+    return columns_to_frame({n: [r.get(n) for r in rows] for n in names})
+
+
+def columns_to_frame(data: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Build a DataFrame from one list per column through Arrow; falls back to pandas for mixed-type columns."""
+    try:
+        table = pa.table(data)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pd.DataFrame(data)
+    return table.to_pandas()
+
+
+def rows_to_frame(columns: Sequence[str], rows: List[tuple], types: Optional[Dict[str, pa.DataType]] = None) -> pd.DataFrame:
+    """Build a DataFrame from positional row tuples; zip(*rows) transposes them into one list per
+    column in C, so hot parsers skip allocating and hashing a dict per row.
+
+    Columns listed in types are converted straight to that Arrow type with no inference pass, and
+    keep the same dtype in every batch even when a game has no values for them."""
+    if not rows:
+        return pd.DataFrame()
+    data = dict(zip(columns, map(list, zip(*rows))))
+    for c, t in (types or {}).items():
+        try:
+            data[c] = pa.array(data[c], type=t)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # values don't fit the declared type; leave the column to inference
+    return columns_to_frame(data)
+
+
+def shrink_dtypes(df: Optional[pd.DataFrame], max_unique_ratio: float = 0.1) -> Optional[pd.DataFrame]:
+    """Store low-cardinality string columns as category and downcast integer columns, in place."""
+    if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+        return df
+    n = len(df)
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            continue
+        if pd.api.types.is_string_dtype(s.dtype):
+            try:
+                unique = s.nunique()
+            except TypeError:
+                continue  # unhashable values (lists/dicts)
+            if 0 < unique and unique / n < max_unique_ratio:
+                df[col] = s.astype("category")
+        elif s.dtype.kind in "iu":
+            df[col] = pd.to_numeric(s, downcast="integer")
+    return df
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """pd.concat that keeps shared category columns categorical by unioning their categories."""
+    frames = [f for f in frames if isinstance(f, pd.DataFrame) and not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) > 1:
+        shared = set.intersection(*({c for c in f.columns if isinstance(f[c].dtype, pd.CategoricalDtype)} for f in frames))
+        for col in shared:
+            try:
+                cats = union_categoricals([f[col] for f in frames]).categories
+            except TypeError:
+                continue  # categories of different dtypes (e.g. str vs object); pd.concat falls back to object
+            frames = [f.assign(**{col: f[col].cat.set_categories(cats)}) for f in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+def append_shard(shards: Dict[str, List[pd.DataFrame]], key: str, df: Optional[pd.DataFrame]) -> None:
+    """Collect a DataFrame under shards[key] for one concat later; ignore None/empty."""
     if df is None or not isinstance(df, pd.DataFrame) or df.empty:
         return
-    current = tables.get(key)
-    before = 0 if not isinstance(current, pd.DataFrame) else int(current.shape[0])
-    add = int(df.shape[0])
-    tables[key] = pd.concat([current, df], ignore_index=True) if isinstance(current, pd.DataFrame) and not current.empty else df
-    after = int(tables[key].shape[0]) if isinstance(tables.get(key), pd.DataFrame) else 0
-    log.info("Table %s concat before=%s add=%s after=%s", key, before, add, after)
+    shards.setdefault(key, []).append(_categorize(df, CAT_COLUMNS.get(key, ())))
+
+
+def concat_shards(shards: Dict[str, List[pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+    """Concatenate each key's shards in a single pass instead of growing a frame per append."""
+    tables: Dict[str, pd.DataFrame] = {}
+    for key, frames in shards.items():
+        tables[key] = frames[0] if len(frames) == 1 else concat_frames(frames)
+        log.info("Table %s concat shards=%s rows=%s", key, len(frames), tables[key].shape[0])
+    return tables
 
 
-def write_tables_to_parquet(root: Path, tables: Dict[str, pd.DataFrame]) -> int:
-    """Write non-empty tables to Parquet under root, return count written."""
+# Multi-season tables written as <name>/season=<S>/ directories so readers can prune by season
+PARTITIONED_TABLES = frozenset({
+    "games", "linescores", "game_teams", "game_players", "plays", "pitches",
+    "player_stats_season", "team_stats_season",
+})
+
+
+def _write_parquet(root: Path, name: str, df: pd.DataFrame, partition: bool) -> None:
+    # Frames built from many shards convert to many small Arrow chunks; merge them so each
+    # column is written from one contiguous buffer instead of many tiny pages
+    table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    if partition and name in PARTITIONED_TABLES and "season" in table.column_names:
+        season_type = table.schema.field("season").type
+        if pa.types.is_dictionary(season_type):
+            idx = table.schema.get_field_index("season")
+            table = table.set_column(idx, "season", table.column("season").cast(season_type.value_type))
+        path = root / name
+        ds.write_dataset(
+            table,
+            base_dir=path,
+            format="parquet",
+            partitioning=["season"],
+            partitioning_flavor="hive",
+            existing_data_behavior="delete_matching",
+            max_rows_per_file=2_000_000,
+            min_rows_per_group=PARQUET_ROW_GROUP_ROWS,
+            max_rows_per_group=PARQUET_ROW_GROUP_ROWS,
+            file_options=ds.ParquetFileFormat().make_write_options(**PARQUET_OPTIONS),
+        )
+    else:
+        path = root / f"{name}.parquet"
+        pq.write_table(table, path, row_group_size=PARQUET_ROW_GROUP_ROWS, **PARQUET_OPTIONS)
+    log.info("Parquet written table=%s rows=%s path=%s", name, df.shape[0], path)
+
+
+def write_tables_to_parquet(root: Path, tables: Dict[str, pd.DataFrame], partition: bool = False) -> int:
+    """Write non-empty tables to Parquet under root, return count written.
+
+    With partition=True, PARTITIONED_TABLES that have a season column are written as season=<S>
+    directories, replacing those seasons' partitions; only full dumps, which hold whole seasons,
+    should ask for that. Otherwise every table is a single <name>.parquet file."""
     root.mkdir(parents=True, exist_ok=True)
-    written = 0
-    for name, df in tables.items():
-        if isinstance(df, pd.DataFrame) and not df.empty:
-            path = root / f"{name}.parquet"
-            df.to_parquet(path, index=False)
-            written += 1
-    return written
-
-
-def to_int_series(s: pd.Series) -> pd.Series:
-    """Safely cast a series to int, dropping NA then returning int dtype."""
-    if s is None:
-        return pd.Series(dtype="int64")
-    return s.dropna().astype(int)
+    todo = {name: df for name, df in tables.items() if isinstance(df, pd.DataFrame) and not df.empty}
+    if not todo:
+        return 0
+    # Arrow encodes and compresses without holding the GIL, so tables write in parallel
+    with cf.ThreadPoolExecutor(max_workers=min(8, len(todo))) as ex:
+        futures = [ex.submit(_write_parquet, root, name, df, partition) for name, df in todo.items()]
+        for fut in futures:
+            fut.result()
+    return len(todo)
+
+
+def _widen_type(t: pa.DataType) -> pa.DataType:
+    if pa.types.is_dictionary(t):
+        return t.value_type
+    if pa.types.is_integer(t):
+        return pa.int64()
+    if pa.types.is_floating(t):
+        return pa.float64()
+    return t
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast table onto schema, filling columns it lacks with nulls."""
+    cols = [
+        table.column(f.name).cast(f.type) if f.name in table.column_names else pa.nulls(table.num_rows, f.type)
+        for f in schema
+    ]
+    return pa.Table.from_arrays(cols, schema=schema)
+
+
+class SeasonPartitionWriter:
+    """Write a table's per-season frames as hive partitions: <base_dir>/season=<S>/part-0.parquet.
+
+    Each partition keeps its own columns, widened (categoricals to their values, ints to int64,
+    floats to float64). close() unifies the partition schemas and rewrites only the partitions that
+    differ, so a column that is all-null or missing in one season takes its type from the others.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.rows = 0
+        self._schemas: Dict[int, pa.Schema] = {}
+
+    def _path(self, season: int) -> Path:
+        return self.base_dir / f"season={season}" / "part-0.parquet"
+
+    def write(self, df: Optional[pd.DataFrame], season: int) -> None:
+        if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if "season" in table.column_names:
+            table = table.drop_columns(["season"])  # carried by the partition path
+        table = _conform(table, pa.schema([pa.field(f.name, _widen_type(f.type)) for f in table.schema]))
+        path = self._path(season)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for old in path.parent.glob("*.parquet"):
+            old.unlink()  # replace the partition, like write_dataset's delete_matching
+        pq.write_table(table, path, row_group_size=PARQUET_ROW_GROUP_ROWS, **PARQUET_OPTIONS)
+        self._schemas[season] = table.schema
+        self.rows += table.num_rows
+        log.info("Parquet partition written path=%s rows=%s", path, table.num_rows)
+
+    def close(self) -> None:
+        """Bring every partition onto one schema so the directory reads as a single dataset."""
+        schemas = list(self._schemas.values())
+        if all(s.equals(schemas[0]) for s in schemas[1:]):
+            return
+        try:
+            unified = pa.unify_schemas(schemas, promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            log.warning("Parquet partitions %s have incompatible schemas, left as written: %s", self.base_dir.name, e)
+            return
+        for season, schema in self._schemas.items():
+            if schema.equals(unified):
+                continue
+            path = self._path(season)
+            pq.write_table(_conform(pq.read_table(path), unified), path,
+                           row_group_size=PARQUET_ROW_GROUP_ROWS, **PARQUET_OPTIONS)
+            self._schemas[season] = unified
+            log.info("Parquet partition rewritten to unified schema path=%s", path)
+
+
+def unique_int_ids(s: Optional[pd.Series]) -> np.ndarray:
+    """Sorted unique int64 ids from a series, skipping NA and non-numeric values."""
+    if s is None or s.empty:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(pd.to_numeric(s, errors="coerce").dropna().to_numpy(dtype=np.int64))
+
@@ -10,9 +10,12 @@
 # Imports and config
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sqlalchemy import create_engine
@@ -35,7 +38,8 @@ DB_URL = os.getenv("DATABASE_URL") or (
     f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@"
     f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_DATABASE')}?charset=utf8mb4"
 )
-ENGINE = create_engine(DB_URL) if USE_DB else None
+# Pooled so the table loads below can run on separate connections
+ENGINE = create_engine(DB_URL, pool_size=8, pool_pre_ping=True) if USE_DB else None
 print("DB_URL:", DB_URL if USE_DB else "<parquet mode>")
 
 # %% [markdown]
@@ -95,7 +99,9 @@ def describe_db_tables() -> None:
 def describe_parquet_tables() -> None:
     print(f"Inspecting Parquet directory: {PARQUET_DIR}")
     for t in MLB_TABLES:
-        p = PARQUET_DIR / f"{t}.parquet"
+        p = PARQUET_DIR / t  # partitioned tables are directories of season=YYYY files
+        if not p.is_dir():
+            p = PARQUET_DIR / f"{t}.parquet"
         if not p.exists():
             continue
         print("\n=== Parquet:", t, "===")
@@ -120,36 +126,94 @@ else:
 SEASON_START = 2023
 SEASON_END = 2025
 
+DETAIL_TABLES = {"game_players", "game_teams", "linescores", "plays", "pitches"}
+READ_CHUNK_ROWS = 200_000
+# Columns the notebook actually uses; tables not listed here are loaded whole
+TABLE_COLUMNS = {
+    "games": [
+        "gamePk", "season", "game_type", "game_datetime", "status_detailedState",
+        "home_team_id", "home_team_name", "away_team_id", "away_team_name",
+    ],
+    "game_teams": ["gamePk", "side", "team_id", "team_name", "batters_total_r"],
+    "standings": ["team_id", "season", "pct"],
+}
 
-def read_table(name: str) -> pd.DataFrame:
-    if USE_DB:
-        # Apply season filter directly for games; join to games for related detail tables
-        if name == "games":
-            q = (
-                "SELECT * FROM `games` WHERE season BETWEEN %s AND %s"
-            )
-            return pd.read_sql(q, ENGINE, params=(SEASON_START, SEASON_END))
 
-        if name in {"game_players", "game_teams", "linescores", "plays", "pitches"}:
-            q = (
-                f"SELECT t.* FROM `{name}` t "
-                "JOIN `games` g ON g.gamePk = t.gamePk "
-                "WHERE g.season BETWEEN %s AND %s"
-            )
-            return pd.read_sql(q, ENGINE, params=(SEASON_START, SEASON_END))
+SEASON_FILTERS = [("season", ">=", SEASON_START), ("season", "<=", SEASON_END)]
+
+
+def _where(filters) -> tuple:
+    """Render pyarrow-style (column, op, value) filters as a SQL condition and its params."""
+    if not filters:
+        return "1=1", ()
+    return " AND ".join(f"`{c}` {op} %s" for c, op, _ in filters), tuple(v for _, _, v in filters)
+
 
-        # All other small tables unfiltered
-        return pd.read_sql(f"SELECT * FROM `{name}`", ENGINE)
-    p = PARQUET_DIR / f"{name}.parquet"
-    return pd.read_parquet(p) if p.exists() else pd.DataFrame()
+def _as_field_type(t, value):
+    """Schedule rows store season as text; compare as text there (4-digit years sort the same)."""
+    if pa.types.is_dictionary(t):
+        t = t.value_type
+    return str(value) if pa.types.is_string(t) or pa.types.is_large_string(t) else value
 
 
-teams = read_table("teams")
-games = read_table("games")
-game_teams = read_table("game_teams")
-game_players = read_table("game_players")
-linescores = read_table("linescores")
-standings = read_table("standings")
+def read_table(name: str, columns=None, filters=None) -> pd.DataFrame:
+    """Load only `columns` (default: TABLE_COLUMNS[name], else all) of the rows matching `filters`."""
+    columns = columns or TABLE_COLUMNS.get(name)
+    if USE_DB:
+        select = ", ".join(f"`{c}`" for c in columns) if columns else "*"
+        where, params = _where(filters)
+        if name in DETAIL_TABLES:
+            # Detail tables carry no season; filter on the primary keys of the matching games instead
+            q = f"SELECT {select} FROM `{name}` WHERE gamePk IN (SELECT gamePk FROM `games` WHERE {where})"
+            # Wide, multi-million-row tables: stream through a server-side cursor in chunks rather
+            # than buffering the whole result in the driver first
+            with ENGINE.connect().execution_options(stream_results=True) as conn:
+                chunks = list(pd.read_sql(q, conn, params=params, chunksize=READ_CHUNK_ROWS))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        return pd.read_sql(f"SELECT {select} FROM `{name}` WHERE {where}", ENGINE, params=params)
+    # full_dump writes game tables as season=YYYY partition directories, so season filters skip
+    # whole files and only the projected columns are decoded; the rest are single files
+    p = PARQUET_DIR / name
+    if not p.is_dir():
+        p = PARQUET_DIR / f"{name}.parquet"
+        if not p.exists():
+            return pd.DataFrame()
+        schema = pq.read_schema(p)
+        fields = set(schema.names)
+        if filters and all(c in fields for c, _, _ in filters):
+            filters = [(c, op, _as_field_type(schema.field(c).type, v)) for c, op, v in filters]
+        elif filters:
+            # update_daily's detail files have no season column; scope them through the games'
+            # primary keys, like the SQL branch
+            if name in DETAIL_TABLES and "gamePk" in fields:
+                pks = read_table("games", ["gamePk"], filters)["gamePk"].tolist()
+                filters = [("gamePk", "in", pks)]
+            else:
+                filters = None
+    return pd.read_parquet(p, columns=columns, filters=filters or None, engine="pyarrow")
+
+
+def read_tables(specs: dict) -> dict:
+    """Load independent tables concurrently from {name: read_table kwargs}; each query runs on its own pooled connection."""
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {name: ex.submit(read_table, name, **kwargs) for name, kwargs in specs.items()}
+        return {name: f.result() for name, f in futures.items()}
+
+
+tables = read_tables({
+    "teams": {},
+    "games": {"filters": SEASON_FILTERS},
+    "game_teams": {"filters": SEASON_FILTERS},
+    "game_players": {"filters": SEASON_FILTERS},
+    "linescores": {"filters": SEASON_FILTERS},
+    "standings": {},
+})
+teams = tables["teams"]
+games = tables["games"]
+game_teams = tables["game_teams"]
+game_players = tables["game_players"]
+linescores = tables["linescores"]
+standings = tables["standings"]
 print("Shapes:", games.shape, game_teams.shape, game_players.shape, linescores.shape)
 
 # %% [markdown]
@@ -165,22 +229,16 @@ print(games["status_detailedState"].value_counts(dropna=False).head(10))
 # Join home/away team totals into a single row per game and compute labels.
 
 # %%
-home = (
-    game_teams.query('side == "home"')
-    .rename(columns={"team_id": "home_team_id", "team_name": "home_team_name"})[
-        ["gamePk", "home_team_id", "home_team_name", "batters_total_r"]
-    ]
-)
-away = (
-    game_teams.query('side == "away"')
-    .rename(columns={"team_id": "away_team_id", "team_name": "away_team_name"})[
-        ["gamePk", "away_team_id", "away_team_name", "batters_total_r"]
-    ]
+# One pass over game_teams: runs per gamePk, one column per side
+game_teams["side"] = game_teams["side"].astype("category")
+runs = (
+    game_teams.pivot_table(index="gamePk", columns="side", values="batters_total_r", aggfunc="first", observed=True)
+    .reindex(columns=["home", "away"])
+    .rename(columns={"home": "home_runs", "away": "away_runs"})
+    .rename_axis(columns=None)
+    .reset_index()
 )
 
-home = home.rename(columns={"batters_total_r": "home_runs"})
-away = away.rename(columns={"batters_total_r": "away_runs"})
-
 meta_cols = [
     "gamePk",
     "season",
@@ -193,14 +251,18 @@ meta_cols = [
 ]
 
 gm = games[meta_cols].drop_duplicates("gamePk").copy()
+# Low-cardinality labels: category codes instead of a Python string per row (DB loads arrive as object)
+for c in ("game_type", "home_team_name", "away_team_name"):
+    gm[c] = gm[c].astype("category")
 # Align dtype of season for merges
 gm["season"] = pd.to_numeric(gm["season"], errors="coerce").astype("Int64")
-gm = gm.merge(home[["gamePk", "home_runs"]], on="gamePk", how="left").merge(
-    away[["gamePk", "away_runs"]], on="gamePk", how="left"
-)
+gm = gm.merge(runs, on="gamePk", how="left")
 
-gm["total_runs"] = gm[["home_runs", "away_runs"]].sum(axis=1, skipna=True)
-gm["home_win"] = (gm["home_runs"] > gm["away_runs"]).astype("Int64")
+h = gm["home_runs"].to_numpy(dtype="float64", na_value=np.nan)
+a = gm["away_runs"].to_numpy(dtype="float64", na_value=np.nan)
+# Missing when neither side has a box score (e.g. scheduled games), so they drop out of the regression
+gm["total_runs"] = np.where(np.isnan(h) & np.isnan(a), np.nan, np.nan_to_num(h) + np.nan_to_num(a))
+gm["home_win"] = pd.array(h > a, dtype="Int64")
 
 print(gm[["home_win", "total_runs"]].describe(include="all"))
 
@@ -209,26 +271,19 @@ print(gm[["home_win", "total_runs"]].describe(include="all"))
 # Use prior season team win percentage as a quick baseline signal.
 
 # %%
-stand = standings.rename(columns={"team_id": "stand_team_id", "season": "stand_season"}).copy()
-stand["prev_season"] = stand["stand_season"].astype("Int64") - 1
+# prev_season is already Int64, matching gm["season"] for the merges
+stand = standings.rename(columns={"team_id": "stand_team_id", "season": "stand_season"})
+stand = stand.assign(prev_season=stand["stand_season"].astype("Int64") - 1)
 
-home_feat = (
-    stand[["stand_team_id", "prev_season", "pct"]]
-    .rename(columns={"stand_team_id": "home_team_id", "prev_season": "season", "pct": "home_prev_pct"})
-    .copy()
+home_feat = stand[["stand_team_id", "prev_season", "pct"]].rename(
+    columns={"stand_team_id": "home_team_id", "prev_season": "season", "pct": "home_prev_pct"}
 )
-home_feat["season"] = pd.to_numeric(home_feat["season"], errors="coerce").astype("Int64")
-away_feat = (
-    stand[["stand_team_id", "prev_season", "pct"]]
-    .rename(columns={"stand_team_id": "away_team_id", "prev_season": "season", "pct": "away_prev_pct"})
-    .copy()
+away_feat = stand[["stand_team_id", "prev_season", "pct"]].rename(
+    columns={"stand_team_id": "away_team_id", "prev_season": "season", "pct": "away_prev_pct"}
 )
-away_feat["season"] = pd.to_numeric(away_feat["season"], errors="coerce").astype("Int64")
 
-Xy = (
-    gm.merge(home_feat, on=["home_team_id", "season"], how="left")
-    .merge(away_feat, on=["away_team_id", "season"], how="left")
-    .copy()
+Xy = gm.merge(home_feat, on=["home_team_id", "season"], how="left").merge(
+    away_feat, on=["away_team_id", "season"], how="left"
 )
 print(Xy[["home_prev_pct", "away_prev_pct"]].describe())
 
@@ -242,7 +297,7 @@ from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.metrics import roc_auc_score, accuracy_score, mean_absolute_error
 
 # Classification
-cls = Xy.dropna(subset=["home_win", "home_prev_pct", "away_prev_pct"]).copy()
+cls = Xy.dropna(subset=["home_win", "home_prev_pct", "away_prev_pct"])
 Xc = cls[["home_prev_pct", "away_prev_pct"]].astype(float)
 yc = cls["home_win"].astype(int)
 Xc_tr, Xc_te, yc_tr, yc_te = train_test_split(
@@ -256,7 +311,7 @@ print("HomeWin AUC:", roc_auc_score(yc_te, probs))
 print("HomeWin ACC:", accuracy_score(yc_te, preds))
 
 # Regression
-reg = Xy.dropna(subset=["total_runs", "home_prev_pct", "away_prev_pct"]).copy()
+reg = Xy.dropna(subset=["total_runs", "home_prev_pct", "away_prev_pct"])
 Xr = reg[["home_prev_pct", "away_prev_pct"]].astype(float)
 yr = reg["total_runs"].astype(float)
 Xr_tr, Xr_te, yr_tr, yr_te = train_test_split(Xr, yr, test_size=0.2, random_state=42)